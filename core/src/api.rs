@@ -1,14 +1,12 @@
 use crate::error::Result;
-use crate::extraction::mammo_type::extract_mammogram_type_impl;
+use crate::extraction::mammo_type::{classify_dbt_object_kind, classify_mammogram_type};
 use crate::extraction::tags::{
     get_int_value, get_string_value, BREAST_IMPLANT_PRESENT, COLUMNS, CONCATENATION_UID,
     IMAGER_PIXEL_SPACING, MANUFACTURER, MANUFACTURER_MODEL_NAME, MODALITY, NUMBER_OF_FRAMES,
     PIXEL_SPACING, PRESENTATION_INTENT_TYPE, ROWS, SOP_CLASS_UID,
     SOP_INSTANCE_UID_OF_CONCATENATION_SOURCE,
 };
-use crate::extraction::{
-    extract_dbt_object_kind, extract_image_type, extract_laterality, extract_view_descriptor,
-};
+use crate::extraction::{extract_image_type, extract_laterality, extract_view_descriptor};
 use crate::types::{
     DbtObjectKind, ImageType, Laterality, MammogramType, MammogramView, MammographyViewModifier,
     PixelSpacing, ViewPosition,
@@ -99,15 +97,16 @@ impl MammogramExtractor {
         is_sfm: bool,
         ignore_modality: bool,
     ) -> Result<MammogramMetadata> {
-        let mammogram_type = extract_mammogram_type_impl(dcm, is_sfm, ignore_modality)?;
+        let image_type = extract_image_type(dcm);
+        let mammogram_type = classify_mammogram_type(dcm, &image_type, is_sfm, ignore_modality)?;
         let view = extract_view_descriptor(dcm);
         Ok(MammogramMetadata {
             mammogram_type,
-            dbt_object_kind: extract_dbt_object_kind(dcm, mammogram_type),
+            dbt_object_kind: classify_dbt_object_kind(dcm, &image_type, mammogram_type),
             laterality: extract_laterality(dcm)?,
             view_position: view.view_position,
             view_modifiers: view.modifiers,
-            image_type: extract_image_type(dcm),
+            image_type,
             is_for_processing: Self::extract_for_processing(dcm),
             has_implant: Self::extract_implant_status(dcm),
             manufacturer: get_string_value(dcm, MANUFACTURER),
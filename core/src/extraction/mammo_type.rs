@@ -3,7 +3,7 @@ use crate::types::{DbtObjectKind, ImageType, MammogramType};
 use dicom_object::InMemDicomObject;
 
 use super::tags::{
-    get_int_value, get_lowercase_string, get_multi_string_value, get_string_value,
+    get_int_value, get_multi_string_value, get_string_value,
     ACQUISITION_DEVICE_PROCESSING_DESCRIPTION, CONCATENATION_UID, IMAGE_TYPE,
     MANUFACTURER_MODEL_NAME, MODALITY, NUMBER_OF_FRAMES, NUMBER_OF_TOMOSYNTHESIS_SOURCE_IMAGES,
     SERIES_DESCRIPTION, SOP_INSTANCE_UID_OF_CONCATENATION_SOURCE, TOMO_CLASS,
@@ -39,6 +39,19 @@ pub fn extract_mammogram_type_impl(
     dcm: &InMemDicomObject,
     is_sfm: bool,
     ignore_modality: bool,
+) -> Result<MammogramType> {
+    classify_mammogram_type(dcm, &extract_image_type(dcm), is_sfm, ignore_modality)
+}
+
+/// Classifies the mammogram type against an already-extracted ImageType
+///
+/// Lets metadata extraction decode ImageType once and share it between type
+/// classification, DBT object kind, and the returned metadata.
+pub(crate) fn classify_mammogram_type(
+    dcm: &InMemDicomObject,
+    img_type: &ImageType,
+    is_sfm: bool,
+    ignore_modality: bool,
 ) -> Result<MammogramType> {
     // 1. Check modality
     if !ignore_modality {
@@ -56,67 +69,62 @@ pub fn extract_mammogram_type_impl(
         return Ok(MammogramType::Tomo);
     }
 
-    // 3. Extract ImageType components
-    let img_type = extract_image_type(dcm);
-    let pixels = img_type.pixels.to_lowercase();
-    let exam = img_type.exam.to_lowercase();
-    let flavor = img_type
-        .flavor
-        .as_ref()
-        .map(|s| s.to_lowercase())
-        .unwrap_or_default();
-
-    // Get additional metadata
-    let machine = get_lowercase_string(dcm, MANUFACTURER_MODEL_NAME);
-    let series_desc = get_lowercase_string(dcm, SERIES_DESCRIPTION);
-
-    // If fields 1 and 2 were missing, default to FFDM
+    // 3. If ImageType fields 1 and 2 were missing, default to FFDM
     if img_type.pixels.is_empty() || img_type.exam.is_empty() {
         return Ok(MammogramType::Ffdm);
     }
 
     // 4. Apply classification rules
+    //
+    // Comparisons are ASCII case-insensitive on the borrowed values rather than on
+    // lowercased copies, so classification does not allocate per component.
 
     // High-confidence explicit rules
     if is_sfm {
         return Ok(MammogramType::Sfm);
     }
 
-    if !series_desc.is_empty() && (series_desc.contains("s-view") || series_desc.contains("c-view"))
-    {
+    if get_string_value(dcm, SERIES_DESCRIPTION).is_some_and(|series_desc| {
+        contains_ignore_ascii_case(&series_desc, "s-view")
+            || contains_ignore_ascii_case(&series_desc, "c-view")
+    }) {
         return Ok(MammogramType::Synth);
     }
 
-    if image_type_component_eq(&img_type, "tomo_2d") {
+    if image_type_component_eq(img_type, "tomo_2d") {
         return Ok(MammogramType::Synth);
     }
 
-    if let Some(ref extras) = img_type.extras {
+    if let Some(extras) = &img_type.extras {
         if extras
             .iter()
-            .any(|x| x.to_lowercase().contains("generated_2d"))
+            .any(|x| contains_ignore_ascii_case(x, "generated_2d"))
         {
             return Ok(MammogramType::Synth);
         }
     }
 
-    if image_type_component_eq(&img_type, "tomo") {
+    if image_type_component_eq(img_type, "tomo") {
         return Ok(MammogramType::Tomo);
     }
 
-    if has_ambiguous_single_frame_volumetric_tomo_evidence(dcm, &img_type) {
+    if has_ambiguous_single_frame_volumetric_tomo_evidence(dcm, img_type) {
         return Ok(MammogramType::Unknown);
     }
 
-    if pixels.contains("original") {
+    if contains_ignore_ascii_case(&img_type.pixels, "original") {
         return Ok(MammogramType::Ffdm);
     }
 
     // Vendor fallback inherited from the Python classifier
-    if pixels == "derived"
-        && exam == "primary"
-        && machine == "fdr-3000aws"
-        && flavor != "post_contrast"
+    if img_type.pixels.eq_ignore_ascii_case("derived")
+        && img_type.exam.eq_ignore_ascii_case("primary")
+        && !img_type
+            .flavor
+            .as_ref()
+            .is_some_and(|flavor| flavor.eq_ignore_ascii_case("post_contrast"))
+        && get_string_value(dcm, MANUFACTURER_MODEL_NAME)
+            .is_some_and(|machine| machine.eq_ignore_ascii_case("fdr-3000aws"))
     {
         return Ok(MammogramType::Synth);
     }
@@ -130,10 +138,17 @@ pub fn extract_dbt_object_kind(
     dcm: &InMemDicomObject,
     mammogram_type: MammogramType,
 ) -> DbtObjectKind {
-    let img_type = extract_image_type(dcm);
+    classify_dbt_object_kind(dcm, &extract_image_type(dcm), mammogram_type)
+}
 
+/// Classifies the DBT object representation against an already-extracted ImageType
+pub(crate) fn classify_dbt_object_kind(
+    dcm: &InMemDicomObject,
+    img_type: &ImageType,
+    mammogram_type: MammogramType,
+) -> DbtObjectKind {
     if mammogram_type == MammogramType::Unknown {
-        if has_ambiguous_single_frame_volumetric_tomo_evidence(dcm, &img_type) {
+        if has_ambiguous_single_frame_volumetric_tomo_evidence(dcm, img_type) {
             return DbtObjectKind::Unknown;
         }
         return DbtObjectKind::None;
@@ -148,7 +163,7 @@ pub fn extract_dbt_object_kind(
         return DbtObjectKind::Volume;
     }
 
-    if image_type_component_eq(&img_type, "tomo") {
+    if image_type_component_eq(img_type, "tomo") {
         return DbtObjectKind::Slice;
     }
 
@@ -162,14 +177,12 @@ pub fn extract_image_type(dcm: &InMemDicomObject) -> ImageType {
     match image_type_values {
         None => ImageType::new(String::new(), String::new(), None, None),
         Some(values) => {
-            let pixels = values.first().cloned().unwrap_or_default();
-            let exam = values.get(1).cloned().unwrap_or_default();
-            let flavor = values.get(2).cloned();
-            let extras = if values.len() > 3 {
-                Some(values[3..].to_vec())
-            } else {
-                None
-            };
+            let mut values = values.into_iter();
+            let pixels = values.next().unwrap_or_default();
+            let exam = values.next().unwrap_or_default();
+            let flavor = values.next();
+            let extras: Vec<String> = values.collect();
+            let extras = (!extras.is_empty()).then_some(extras);
 
             ImageType::new(pixels, exam, flavor, extras)
         }
@@ -265,6 +278,14 @@ fn has_non_empty_tag(dcm: &InMemDicomObject, tag: dicom_core::Tag) -> bool {
     get_string_value(dcm, tag).is_some_and(|value| !value.is_empty())
 }
 
+fn contains_ignore_ascii_case(haystack: &str, needle: &str) -> bool {
+    needle.is_empty()
+        || haystack
+            .as_bytes()
+            .windows(needle.len())
+            .any(|window| window.eq_ignore_ascii_case(needle.as_bytes()))
+}
+
 fn contains_exact_token(value: &str, expected: &str) -> bool {
     value
         .split(|ch: char| !ch.is_ascii_alphanumeric())
@@ -521,6 +542,36 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_series_description_synth_case_insensitive() {
+        let mut dcm = create_test_dicom("DERIVED|PRIMARY", "MG");
+        put_str(&mut dcm, SERIES_DESCRIPTION, VR::LO, "L CC C-View");
+        let result = extract_mammogram_type(&dcm, false).unwrap();
+        assert_eq!(result, MammogramType::Synth);
+    }
+
+    #[test]
+    fn test_fdr_3000aws_fallback_classified_as_synth() {
+        let mut dcm = create_test_dicom("DERIVED|PRIMARY", "MG");
+        put_str(&mut dcm, MANUFACTURER_MODEL_NAME, VR::LO, "FDR-3000AWS");
+        let result = extract_mammogram_type(&dcm, false).unwrap();
+        assert_eq!(result, MammogramType::Synth);
+
+        let mut dcm = create_test_dicom("DERIVED|PRIMARY|POST_CONTRAST", "MG");
+        put_str(&mut dcm, MANUFACTURER_MODEL_NAME, VR::LO, "FDR-3000AWS");
+        let result = extract_mammogram_type(&dcm, false).unwrap();
+        assert_eq!(result, MammogramType::Ffdm);
+    }
+
+    #[test]
+    fn test_contains_ignore_ascii_case() {
+        assert!(contains_ignore_ascii_case("Generated_2D", "generated_2d"));
+        assert!(contains_ignore_ascii_case("R MLO S-VIEW", "s-view"));
+        assert!(contains_ignore_ascii_case("anything", ""));
+        assert!(!contains_ignore_ascii_case("2d", "generated_2d"));
+        assert!(!contains_ignore_ascii_case("DERIVED", "original"));
+    }
+
     #[test]
     fn test_default_to_ffdm() {
         // Test that DERIVED|PRIMARY without special markers defaults to FFDM
@@ -89,6 +89,12 @@ pub const ACCESSION_NUMBER: Tag = Tag(0x0008, 0x0050);
 // Pixel Data Tag - used to stop reading before large pixel data
 pub const PIXEL_DATA_TAG: Tag = Tag(0x7FE0, 0x0010);
 
+// Per-frame Functional Groups Sequence - used to stop metadata-only reads.
+// Extraction never reads this tag or anything after it, and for multi-frame
+// DBT objects it holds one item per frame, so stopping here skips it along
+// with pixel data.
+pub const METADATA_READ_UNTIL_TAG: Tag = Tag(0x5200, 0x9230);
+
 /// DICOM magic bytes that appear at offset 128 in valid DICOM files
 pub const DICOM_MAGIC_BYTES: &[u8] = b"DICM";
 
@@ -174,4 +180,11 @@ mod tests {
         assert_eq!(VIEW_POSITION, Tag(0x0018, 0x5101));
         assert_eq!(PADDLE_DESCRIPTION, Tag(0x0018, 0x11A4));
     }
+
+    #[test]
+    fn test_metadata_read_until_tag_follows_extracted_tags() {
+        assert!(SHARED_FUNCTIONAL_GROUPS_SEQUENCE < METADATA_READ_UNTIL_TAG);
+        assert!(VIEW_MODIFIER_CODE_SEQUENCE < METADATA_READ_UNTIL_TAG);
+        assert!(METADATA_READ_UNTIL_TAG < PIXEL_DATA_TAG);
+    }
 }
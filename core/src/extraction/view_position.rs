@@ -395,8 +395,8 @@ pub fn from_str(value: &str, strict: bool) -> ViewPosition {
     let normalized = normalize_text(value);
     let exact = VIEW_CODE_DEFINITIONS.iter().find_map(|definition| {
         let short = definition.view.short_str();
-        let meaning = normalize_text(definition.code_meaning);
-        (normalized == short || normalized == meaning).then_some(definition.view)
+        (normalized == short || normalized_eq(&normalized, definition.code_meaning))
+            .then_some(definition.view)
     });
     if exact.is_some() || strict {
         return exact.unwrap_or(ViewPosition::Unknown);
@@ -414,8 +414,7 @@ fn modifier_from_text(value: &str, strict: bool) -> Option<MammographyViewModifi
     let exact = VIEW_MODIFIER_CODE_DEFINITIONS
         .iter()
         .find_map(|definition| {
-            let meaning = normalize_text(definition.code_meaning);
-            (normalized == meaning).then_some(definition.modifier)
+            normalized_eq(&normalized, definition.code_meaning).then_some(definition.modifier)
         });
     if exact.is_some() {
         return exact;
@@ -503,6 +502,24 @@ fn normalize_text(value: &str) -> String {
         .join(" ")
 }
 
+/// Whether `normalized` (output of [`normalize_text`]) equals `normalize_text(raw)`.
+///
+/// Compares token by token so the static code meanings matched on every item
+/// are not normalized into a fresh `String` for each comparison.
+fn normalized_eq(normalized: &str, raw: &str) -> bool {
+    let mut actual = normalized.split(' ').filter(|part| !part.is_empty());
+    let mut expected = raw
+        .split(|character: char| !character.is_ascii_alphanumeric())
+        .filter(|part| !part.is_empty());
+    loop {
+        match (actual.next(), expected.next()) {
+            (None, None) => return true,
+            (Some(left), Some(right)) if left.eq_ignore_ascii_case(right) => {}
+            _ => return false,
+        }
+    }
+}
+
 fn contains_token(value: &str, token: &str) -> bool {
     value
         .split(|character: char| !character.is_ascii_alphanumeric())
@@ -566,6 +583,34 @@ mod tests {
         }
     }
 
+    #[test]
+    fn normalized_eq_matches_normalize_text_equality() {
+        let meanings = VIEW_CODE_DEFINITIONS
+            .iter()
+            .map(|definition| definition.code_meaning)
+            .chain(
+                VIEW_MODIFIER_CODE_DEFINITIONS
+                    .iter()
+                    .map(|definition| definition.code_meaning),
+            );
+        for meaning in meanings {
+            for value in [
+                meaning.to_string(),
+                meaning.to_uppercase(),
+                format!("  {}  ", meaning.replace(' ', "_")),
+                format!("{meaning} view"),
+                String::new(),
+            ] {
+                let normalized = normalize_text(&value);
+                assert_eq!(
+                    normalized_eq(&normalized, meaning),
+                    normalized == normalize_text(meaning),
+                    "{value:?} vs {meaning:?}"
+                );
+            }
+        }
+    }
+
     #[test]
     fn parses_legacy_snomed_rt_aliases() {
         for definition in VIEW_CODE_DEFINITIONS {
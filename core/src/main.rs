@@ -2,7 +2,7 @@ use clap::Parser;
 use dicom_object::OpenFileOptions;
 use log::info;
 use mammocat_core::cli::{Cli, OutputFormat};
-use mammocat_core::extraction::tags::PIXEL_DATA_TAG;
+use mammocat_core::extraction::tags::METADATA_READ_UNTIL_TAG;
 use mammocat_core::{MammogramExtractor, TextReport};
 use std::process;
 
@@ -22,9 +22,9 @@ fn main() {
 
     info!("Reading DICOM file: {}", cli.file.display());
 
-    // Open DICOM file (metadata only, skip pixel data for performance)
+    // Open DICOM file (metadata only, skip per-frame groups and pixel data for performance)
     let dcm = match OpenFileOptions::new()
-        .read_until(PIXEL_DATA_TAG)
+        .read_until(METADATA_READ_UNTIL_TAG)
         .open_file(&cli.file)
     {
         Ok(obj) => obj,
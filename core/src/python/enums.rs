@@ -1,13 +1,14 @@
 //! Python wrappers for mammocat enums and data structures
 
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
 use std::collections::hash_map::DefaultHasher;
 use std::hash::{Hash, Hasher};
 
 use super::macros::impl_py_from;
 use crate::types::{
     DbtObjectKind, ImageType, Laterality, MammogramType, MammogramView, MammographyViewModifier,
-    PhotometricInterpretation, PreferenceOrder, ViewPosition,
+    PhotometricInterpretation, PreferenceOrder, ViewPosition, STANDARD_MAMMO_VIEWS,
 };
 
 // ============================================================================
@@ -55,8 +56,8 @@ impl PyMammogramType {
         self.inner.is_preferred_to(&other.inner)
     }
 
-    fn __str__(&self) -> String {
-        self.inner.simple_name().to_string()
+    fn __str__(&self) -> &'static str {
+        self.inner.simple_name()
     }
 
     fn __repr__(&self) -> String {
@@ -130,8 +131,8 @@ impl PyDbtObjectKind {
         self.inner.simple_name()
     }
 
-    fn __str__(&self) -> String {
-        self.inner.simple_name().to_string()
+    fn __str__(&self) -> &'static str {
+        self.inner.simple_name()
     }
 
     fn __repr__(&self) -> String {
@@ -215,8 +216,8 @@ impl PyLaterality {
         self.inner.simple_name()
     }
 
-    fn __str__(&self) -> String {
-        self.inner.simple_name().to_string()
+    fn __str__(&self) -> &'static str {
+        self.inner.simple_name()
     }
 
     fn __repr__(&self) -> String {
@@ -326,8 +327,8 @@ impl PyViewPosition {
         self.inner.simple_name()
     }
 
-    fn __str__(&self) -> String {
-        self.inner.simple_name().to_string()
+    fn __str__(&self) -> &'static str {
+        self.inner.simple_name()
     }
 
     fn __repr__(&self) -> String {
@@ -765,3 +766,28 @@ impl PyMammogramView {
 }
 
 impl_py_from!(PyMammogramView, MammogramView);
+
+/// Python objects for [`STANDARD_MAMMO_VIEWS`], created once per interpreter
+static STANDARD_VIEWS: GILOnceCell<Vec<Py<PyMammogramView>>> = GILOnceCell::new();
+
+impl PyMammogramView {
+    /// Returns a Python object for `view`, sharing one instance per standard view
+    ///
+    /// Views are immutable and compare by value, so handing out the same object
+    /// is safe; set and dict lookups of standard views then hit on identity.
+    pub(crate) fn interned(py: Python<'_>, view: MammogramView) -> PyResult<Py<PyMammogramView>> {
+        let standard_views = STANDARD_VIEWS.get_or_try_init(py, || {
+            STANDARD_MAMMO_VIEWS
+                .iter()
+                .map(|standard_view| Py::new(py, PyMammogramView::from(*standard_view)))
+                .collect::<PyResult<Vec<_>>>()
+        })?;
+        match STANDARD_MAMMO_VIEWS
+            .iter()
+            .position(|standard_view| *standard_view == view)
+        {
+            Some(slot) => Ok(standard_views[slot].clone_ref(py)),
+            None => Py::new(py, PyMammogramView::from(view)),
+        }
+    }
+}
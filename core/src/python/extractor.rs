@@ -1,16 +1,24 @@
 //! Python wrapper for MammogramExtractor
 
-use dicom_object::OpenFileOptions;
 use pyo3::prelude::*;
+use std::collections::{HashMap, VecDeque};
+use std::path::Path;
+use std::sync::{Mutex, OnceLock, PoisonError};
+use std::time::SystemTime;
 
 use super::errors::convert_error;
 use super::metadata::PyMammogramMetadata;
 use super::utils::path_to_pathbuf;
+use crate::api::MammogramMetadata;
+
+/// Maximum number of files whose metadata is kept by the extraction cache.
+const METADATA_CACHE_CAPACITY: usize = 4096;
 
 /// Main extractor for mammography metadata from DICOM files
 ///
 /// This class provides static methods to extract metadata from DICOM files
-/// by accepting file paths.
+/// by accepting file paths. Passing `cache=True` reuses results for files whose
+/// identity, modification time, change time and size are unchanged.
 #[pyclass(name = "MammogramExtractor", module = "mammocat")]
 pub struct PyMammogramExtractor;
 
@@ -20,6 +28,8 @@ impl PyMammogramExtractor {
     ///
     /// Args:
     ///     path: Path to the DICOM file (str or pathlib.Path)
+    ///     cache: Reuse the result of an earlier cached extraction of the
+    ///         unchanged file (default: False)
     ///
     /// Returns:
     ///     MammogramMetadata: Extracted metadata
@@ -35,21 +45,17 @@ impl PyMammogramExtractor {
     ///     >>> metadata = MammogramExtractor.extract_from_file("mammogram.dcm")
     ///     >>> print(metadata.mammogram_type)
     #[staticmethod]
-    #[pyo3(signature = (path))]
-    fn extract_from_file(path: &Bound<'_, PyAny>) -> PyResult<PyMammogramMetadata> {
+    #[pyo3(signature = (path, *, cache=false))]
+    fn extract_from_file(
+        py: Python<'_>,
+        path: &Bound<'_, PyAny>,
+        cache: bool,
+    ) -> PyResult<PyMammogramMetadata> {
         // Convert path to PathBuf
         let path_buf = path_to_pathbuf(path)?;
 
-        // Open DICOM file
-        let dcm = OpenFileOptions::new()
-            .read_until(crate::extraction::tags::PIXEL_DATA_TAG)
-            .open_file(&path_buf)
-            .map_err(|e| {
-                pyo3::exceptions::PyIOError::new_err(format!("Failed to open DICOM file: {}", e))
-            })?;
-
-        // Extract metadata
-        let metadata = crate::api::MammogramExtractor::extract_file(&dcm).map_err(convert_error)?;
+        // Read and extract without holding the GIL
+        let metadata = py.allow_threads(|| extract_metadata_from_path(&path_buf, false, cache))?;
 
         Ok(metadata.into())
     }
@@ -59,6 +65,8 @@ impl PyMammogramExtractor {
     /// Args:
     ///     path: Path to the DICOM file (str or pathlib.Path)
     ///     is_sfm: Whether to treat as SFM instead of FFDM (default: False)
+    ///     cache: Reuse the result of an earlier cached extraction of the
+    ///         unchanged file (default: False)
     ///
     /// Returns:
     ///     MammogramMetadata: Extracted metadata
@@ -75,26 +83,144 @@ impl PyMammogramExtractor {
     ///     ...     "mammogram.dcm", is_sfm=True
     ///     ... )
     #[staticmethod]
-    #[pyo3(signature = (path, is_sfm=false))]
+    #[pyo3(signature = (path, is_sfm=false, *, cache=false))]
     fn extract_from_file_with_options(
+        py: Python<'_>,
         path: &Bound<'_, PyAny>,
         is_sfm: bool,
+        cache: bool,
     ) -> PyResult<PyMammogramMetadata> {
         // Convert path to PathBuf
         let path_buf = path_to_pathbuf(path)?;
 
-        // Open DICOM file
-        let dcm = OpenFileOptions::new()
-            .read_until(crate::extraction::tags::PIXEL_DATA_TAG)
-            .open_file(&path_buf)
-            .map_err(|e| {
-                pyo3::exceptions::PyIOError::new_err(format!("Failed to open DICOM file: {}", e))
-            })?;
-
-        // Extract metadata with options
-        let metadata = crate::api::MammogramExtractor::extract_file_with_options(&dcm, is_sfm)
-            .map_err(convert_error)?;
+        // Read and extract with options without holding the GIL
+        let metadata = py.allow_threads(|| extract_metadata_from_path(&path_buf, is_sfm, cache))?;
 
         Ok(metadata.into())
     }
+
+    /// Clear cached extraction results
+    ///
+    /// Only needed when a file may have been rewritten in place without its
+    /// timestamps or size changing.
+    #[staticmethod]
+    fn clear_cache() {
+        metadata_cache()
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .clear();
+    }
+}
+
+/// Identifies a file's contents by where it lives and what `stat` reports for it.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct FileKey {
+    #[cfg(unix)]
+    identity: (u64, u64),
+    #[cfg(not(unix))]
+    identity: std::path::PathBuf,
+    modified: Option<SystemTime>,
+    /// Inode change time, which also moves on writes that restore the mtime.
+    #[cfg(unix)]
+    changed: (i64, i64),
+    len: u64,
+}
+
+impl FileKey {
+    fn for_path(path: &Path) -> std::io::Result<Self> {
+        let stat = std::fs::metadata(path)?;
+        #[cfg(unix)]
+        let (identity, changed) = {
+            use std::os::unix::fs::MetadataExt;
+            ((stat.dev(), stat.ino()), (stat.ctime(), stat.ctime_nsec()))
+        };
+        #[cfg(not(unix))]
+        let identity = std::fs::canonicalize(path)?;
+        Ok(Self {
+            identity,
+            modified: stat.modified().ok(),
+            #[cfg(unix)]
+            changed,
+            len: stat.len(),
+        })
+    }
+}
+
+/// Bounded cache of extracted metadata, evicting the oldest entry when full.
+#[derive(Default)]
+struct MetadataCache {
+    entries: HashMap<(FileKey, bool), MammogramMetadata>,
+    order: VecDeque<(FileKey, bool)>,
+}
+
+impl MetadataCache {
+    fn get(&self, key: &(FileKey, bool)) -> Option<MammogramMetadata> {
+        self.entries.get(key).cloned()
+    }
+
+    fn insert(&mut self, key: (FileKey, bool), metadata: MammogramMetadata) {
+        if self.entries.insert(key.clone(), metadata).is_some() {
+            return;
+        }
+        self.order.push_back(key);
+        if self.order.len() > METADATA_CACHE_CAPACITY {
+            if let Some(oldest) = self.order.pop_front() {
+                self.entries.remove(&oldest);
+            }
+        }
+    }
+
+    fn clear(&mut self) {
+        self.entries.clear();
+        self.order.clear();
+    }
+}
+
+fn metadata_cache() -> &'static Mutex<MetadataCache> {
+    static CACHE: OnceLock<Mutex<MetadataCache>> = OnceLock::new();
+    CACHE.get_or_init(Default::default)
+}
+
+/// Extracts metadata for a DICOM file, reusing a cached result if `cache` is set
+/// and the file is unchanged
+///
+/// Touches no Python objects, so callers run it inside `allow_threads`.
+fn extract_metadata_from_path(
+    path: &Path,
+    is_sfm: bool,
+    cache: bool,
+) -> PyResult<MammogramMetadata> {
+    if !cache {
+        return read_metadata_from_path(path, is_sfm);
+    }
+    // A failed stat skips the cache; opening the file reports the error.
+    let Ok(file_key) = FileKey::for_path(path) else {
+        return read_metadata_from_path(path, is_sfm);
+    };
+    let key = (file_key, is_sfm);
+
+    let metadata_cache = metadata_cache();
+    if let Some(metadata) = metadata_cache
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .get(&key)
+    {
+        return Ok(metadata);
+    }
+
+    let metadata = read_metadata_from_path(path, is_sfm)?;
+    metadata_cache
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .insert(key, metadata.clone());
+    Ok(metadata)
+}
+
+/// Opens a DICOM file and extracts its metadata
+fn read_metadata_from_path(path: &Path, is_sfm: bool) -> PyResult<MammogramMetadata> {
+    let dcm = crate::selection::open_metadata(path).map_err(|e| {
+        pyo3::exceptions::PyIOError::new_err(format!("Failed to open DICOM file: {}", e))
+    })?;
+
+    crate::api::MammogramExtractor::extract_file_with_options(&dcm, is_sfm).map_err(convert_error)
 }
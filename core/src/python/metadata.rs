@@ -1,5 +1,6 @@
 //! Python wrapper for MammogramMetadata
 
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
@@ -166,8 +167,10 @@ impl PyMammogramMetadata {
     }
 
     /// Returns the mammogram view (laterality + view position)
-    fn mammogram_view(&self) -> PyMammogramView {
-        self.inner.mammogram_view().into()
+    ///
+    /// Standard views (L/R CC and MLO) are shared instances.
+    fn mammogram_view(&self, py: Python) -> PyResult<Py<PyMammogramView>> {
+        PyMammogramView::interned(py, self.inner.mammogram_view())
     }
 
     /// Checks if this is a standard mammography view (CC or MLO)
@@ -182,42 +185,68 @@ impl PyMammogramMetadata {
 
     /// Convert metadata to dictionary
     pub fn to_dict(&self, py: Python) -> PyResult<Py<PyDict>> {
+        // Keys are interned once per process, so repeated calls reuse the same
+        // str objects (and their cached hashes) instead of building new ones.
         let dict = PyDict::new_bound(py);
         dict.set_item(
-            "mammogram_type",
+            intern!(py, "mammogram_type"),
             self.inner.mammogram_type.serialized_name(),
         )?;
-        dict.set_item("dbt_object_kind", self.dbt_object_kind().simple_name())?;
-        dict.set_item("laterality", self.laterality().simple_name())?;
-        dict.set_item("view_position", self.view_position().simple_name())?;
         dict.set_item(
-            "view_modifiers",
+            intern!(py, "dbt_object_kind"),
+            self.dbt_object_kind().simple_name(),
+        )?;
+        dict.set_item(intern!(py, "laterality"), self.laterality().simple_name())?;
+        dict.set_item(
+            intern!(py, "view_position"),
+            self.view_position().simple_name(),
+        )?;
+        dict.set_item(
+            intern!(py, "view_modifiers"),
             self.inner
                 .view_modifiers
                 .iter()
                 .map(|modifier| modifier.simple_name())
                 .collect::<Vec<_>>(),
         )?;
-        dict.set_item("image_type", format!("{}", self.inner.image_type))?;
-        dict.set_item("is_for_processing", self.is_for_processing())?;
-        dict.set_item("has_implant", self.has_implant())?;
-        dict.set_item("is_spot_compression", self.is_spot_compression())?;
-        dict.set_item("is_magnified", self.is_magnified())?;
-        dict.set_item("is_implant_displaced", self.is_implant_displaced())?;
-        dict.set_item("manufacturer", self.manufacturer(py))?;
-        dict.set_item("model", self.model(py))?;
-        dict.set_item("number_of_frames", self.number_of_frames())?;
-        dict.set_item("pixel_spacing", self.pixel_spacing(py)?)?;
-        dict.set_item("concatenation_uid", self.concatenation_uid(py))?;
         dict.set_item(
-            "sop_instance_uid_of_concatenation_source",
+            intern!(py, "image_type"),
+            format!("{}", self.inner.image_type),
+        )?;
+        dict.set_item(intern!(py, "is_for_processing"), self.is_for_processing())?;
+        dict.set_item(intern!(py, "has_implant"), self.has_implant())?;
+        dict.set_item(
+            intern!(py, "is_spot_compression"),
+            self.is_spot_compression(),
+        )?;
+        dict.set_item(intern!(py, "is_magnified"), self.is_magnified())?;
+        dict.set_item(
+            intern!(py, "is_implant_displaced"),
+            self.is_implant_displaced(),
+        )?;
+        dict.set_item(intern!(py, "manufacturer"), self.manufacturer(py))?;
+        dict.set_item(intern!(py, "model"), self.model(py))?;
+        dict.set_item(intern!(py, "number_of_frames"), self.number_of_frames())?;
+        dict.set_item(intern!(py, "pixel_spacing"), self.pixel_spacing(py)?)?;
+        dict.set_item(intern!(py, "concatenation_uid"), self.concatenation_uid(py))?;
+        dict.set_item(
+            intern!(py, "sop_instance_uid_of_concatenation_source"),
             self.sop_instance_uid_of_concatenation_source(py),
         )?;
-        dict.set_item("is_secondary_capture", self.is_secondary_capture())?;
-        dict.set_item("modality", self.modality(py))?;
-        dict.set_item("transfer_syntax_uid", self.transfer_syntax_uid(py))?;
-        dict.set_item("transfer_syntax_name", self.transfer_syntax_name(py))?;
-        dict.set_item("compression_type", self.compression_type(py))?;
+        dict.set_item(
+            intern!(py, "is_secondary_capture"),
+            self.is_secondary_capture(),
+        )?;
+        dict.set_item(intern!(py, "modality"), self.modality(py))?;
+        dict.set_item(
+            intern!(py, "transfer_syntax_uid"),
+            self.transfer_syntax_uid(py),
+        )?;
+        dict.set_item(
+            intern!(py, "transfer_syntax_name"),
+            self.transfer_syntax_name(py),
+        )?;
+        dict.set_item(intern!(py, "compression_type"), self.compression_type(py))?;
         Ok(dict.unbind())
     }
 
@@ -1,21 +1,34 @@
 //! Python wrapper for MammogramRecord
 
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyString};
+use std::num::NonZeroUsize;
+use std::sync::OnceLock;
 
 use super::enums::PyPreferenceOrder;
 use super::errors::convert_error;
 use super::metadata::PyMammogramMetadata;
-use super::utils::{option_string_to_py, option_u16_to_py, path_to_pathbuf};
+use super::utils::{
+    buffer_bytes, fspath_to_pathbuf, option_string_to_py, option_u16_to_py, path_to_pathbuf,
+};
 
 /// Mammogram record combining file path and extracted metadata
 ///
 /// Used for preferred view selection with comparison logic for
 /// determining the best mammogram among multiple options.
 #[pyclass(name = "MammogramRecord", module = "mammocat")]
-#[derive(Clone)]
 pub struct PyMammogramRecord {
     pub(crate) inner: crate::selection::MammogramRecord,
+    /// Python view of `inner.metadata`, built on first access and then shared
+    metadata: OnceLock<Py<PyMammogramMetadata>>,
+}
+
+impl Clone for PyMammogramRecord {
+    fn clone(&self) -> Self {
+        self.inner.clone().into()
+    }
 }
 
 #[pymethods]
@@ -23,6 +36,8 @@ impl PyMammogramRecord {
     /// Create a record from a DICOM file path
     ///
     /// Only reads DICOM metadata (headers), not pixel data, for optimal performance.
+    /// The GIL is released while the file is read, so calls from a thread pool
+    /// run concurrently.
     ///
     /// Args:
     ///     path: Path to the DICOM file (str or pathlib.Path)
@@ -39,19 +54,83 @@ impl PyMammogramRecord {
     ///     >>> record = MammogramRecord.from_file("mammogram.dcm")
     ///     >>> print(record.metadata.mammogram_type)
     #[staticmethod]
-    fn from_file(path: &Bound<'_, PyAny>) -> PyResult<PyMammogramRecord> {
+    fn from_file(py: Python<'_>, path: &Bound<'_, PyAny>) -> PyResult<PyMammogramRecord> {
         let path_buf = path_to_pathbuf(path)?;
-        let record =
-            crate::selection::MammogramRecord::from_file(path_buf).map_err(convert_error)?;
-        Ok(PyMammogramRecord { inner: record })
+        let record = py
+            .allow_threads(|| crate::selection::MammogramRecord::from_file(path_buf))
+            .map_err(convert_error)?;
+        Ok(record.into())
+    }
+
+    /// Create records from many DICOM file paths
+    ///
+    /// Reads all headers inside the extension without holding the GIL, on up
+    /// to `max_workers` threads (one per core by default). Each worker reuses
+    /// a single read buffer. Pass `max_workers=1` to read on the calling
+    /// thread, e.g. when the caller already runs its own worker pool. Prefer
+    /// this over calling `from_file` in a loop.
+    /// Any iterable of paths is accepted, including a `Path.glob()` generator,
+    /// and `os.PathLike` objects are converted with `os.fspath()`, so there is
+    /// no need to call `str()` on each path first.
+    ///
+    /// Args:
+    ///     paths: Iterable of paths to the DICOM files (str or os.PathLike)
+    ///     max_workers: Maximum number of reader threads (default: one per core)
+    ///
+    /// Returns:
+    ///     list[MammogramRecord]: Records in the same order as `paths`
+    ///
+    /// Raises:
+    ///     TypeError: If `paths` is a single string or an item is not a path
+    ///     ValueError: If `max_workers` is less than 1
+    ///     DicomError: If any file cannot be read or parsed
+    ///     ExtractionError: If metadata extraction fails for any file
+    ///
+    /// Example:
+    ///     >>> from mammocat import MammogramRecord
+    ///     >>> from pathlib import Path
+    ///     >>> records = MammogramRecord.from_paths(Path("dicoms").glob("*.dcm"))
+    #[staticmethod]
+    #[pyo3(signature = (paths, *, max_workers=None))]
+    fn from_paths(
+        py: Python<'_>,
+        paths: &Bound<'_, PyAny>,
+        max_workers: Option<usize>,
+    ) -> PyResult<Vec<PyMammogramRecord>> {
+        if paths.is_instance_of::<PyString>() {
+            return Err(PyTypeError::new_err(
+                "paths must be an iterable of paths, not a single string",
+            ));
+        }
+        let max_workers = match max_workers {
+            Some(workers) => Some(
+                NonZeroUsize::new(workers)
+                    .ok_or_else(|| PyValueError::new_err("max_workers must be at least 1"))?,
+            ),
+            None => None,
+        };
+        let path_bufs = paths
+            .iter()?
+            .map(|path| fspath_to_pathbuf(&path?))
+            .collect::<PyResult<Vec<_>>>()?;
+        let records = py
+            .allow_threads(|| {
+                crate::selection::MammogramRecord::from_paths_parallel(&path_bufs, max_workers)
+            })
+            .map_err(convert_error)?;
+        Ok(records.into_iter().map(PyMammogramRecord::from).collect())
     }
 
     /// Create a record from in-memory DICOM bytes
     ///
     /// Parses the DICOM object from bytes and extracts mammogram metadata.
+    /// Any buffer is accepted. `bytes` objects are parsed in place without
+    /// copying; other buffers such as a `bytearray`, `memoryview` or `mmap` are
+    /// copied first, since their contents could change while the GIL is
+    /// released for parsing.
     ///
     /// Args:
-    ///     data: Raw DICOM file bytes
+    ///     data: Raw DICOM file bytes (bytes, bytearray, memoryview, or mmap)
     ///     id: Optional identifier for this record (for debugging/logging)
     ///
     /// Returns:
@@ -69,24 +148,40 @@ impl PyMammogramRecord {
     ///     >>> print(record.metadata.mammogram_type)
     #[staticmethod]
     #[pyo3(signature = (data, id=None))]
-    fn from_bytes(data: &[u8], id: Option<&str>) -> PyResult<PyMammogramRecord> {
-        let record =
-            crate::selection::MammogramRecord::from_bytes(data, id).map_err(convert_error)?;
-        Ok(PyMammogramRecord { inner: record })
+    fn from_bytes(
+        py: Python<'_>,
+        data: &Bound<'_, PyAny>,
+        id: Option<&str>,
+    ) -> PyResult<PyMammogramRecord> {
+        let bytes = buffer_bytes(py, data)?;
+        let record = py
+            .allow_threads(|| crate::selection::MammogramRecord::from_bytes(&bytes, id))
+            .map_err(convert_error)?;
+        Ok(record.into())
     }
 
     /// Path to the DICOM file
     #[getter]
-    fn file_path(&self) -> String {
-        self.inner.file_path.to_str().unwrap_or("").to_string()
+    fn file_path(&self) -> &str {
+        self.inner.file_path.to_str().unwrap_or("")
     }
 
     /// Extracted mammography metadata
+    ///
+    /// The metadata object is created once per record and returned on every
+    /// access, so repeated `record.metadata.<attr>` lookups do not copy it.
     #[getter]
-    fn metadata(&self) -> PyMammogramMetadata {
-        PyMammogramMetadata {
-            inner: self.inner.metadata.clone(),
+    fn metadata(&self, py: Python<'_>) -> PyResult<Py<PyMammogramMetadata>> {
+        if let Some(metadata) = self.metadata.get() {
+            return Ok(metadata.clone_ref(py));
         }
+        let metadata = Py::new(
+            py,
+            PyMammogramMetadata {
+                inner: self.inner.metadata.clone(),
+            },
+        )?;
+        Ok(self.metadata.get_or_init(|| metadata).clone_ref(py))
     }
 
     /// Study Instance UID (if available)
@@ -215,19 +310,42 @@ impl PyMammogramRecord {
 
     /// Convert record to dictionary
     fn to_dict(&self, py: Python) -> PyResult<Py<PyDict>> {
+        // Keys are interned once per process, so repeated calls reuse the same
+        // str objects (and their cached hashes) instead of building new ones.
         let dict = PyDict::new_bound(py);
-        dict.set_item("file_path", self.file_path())?;
-        dict.set_item("metadata", self.metadata().to_dict(py)?)?;
-        dict.set_item("study_instance_uid", self.study_instance_uid(py))?;
-        dict.set_item("series_instance_uid", self.series_instance_uid(py))?;
-        dict.set_item("sop_instance_uid", self.sop_instance_uid(py))?;
-        dict.set_item("rows", self.rows(py))?;
-        dict.set_item("columns", self.columns(py))?;
-        dict.set_item("transfer_syntax_uid", self.transfer_syntax_uid(py))?;
-        dict.set_item("is_lossy_compressed", self.is_lossy_compressed())?;
-        dict.set_item("is_implant_displaced", self.is_implant_displaced())?;
-        dict.set_item("is_spot_compression", self.is_spot_compression())?;
-        dict.set_item("is_magnified", self.is_magnified())?;
+        dict.set_item(intern!(py, "file_path"), self.file_path())?;
+        dict.set_item(
+            intern!(py, "metadata"),
+            self.metadata(py)?.borrow(py).to_dict(py)?,
+        )?;
+        dict.set_item(
+            intern!(py, "study_instance_uid"),
+            self.study_instance_uid(py),
+        )?;
+        dict.set_item(
+            intern!(py, "series_instance_uid"),
+            self.series_instance_uid(py),
+        )?;
+        dict.set_item(intern!(py, "sop_instance_uid"), self.sop_instance_uid(py))?;
+        dict.set_item(intern!(py, "rows"), self.rows(py))?;
+        dict.set_item(intern!(py, "columns"), self.columns(py))?;
+        dict.set_item(
+            intern!(py, "transfer_syntax_uid"),
+            self.transfer_syntax_uid(py),
+        )?;
+        dict.set_item(
+            intern!(py, "is_lossy_compressed"),
+            self.is_lossy_compressed(),
+        )?;
+        dict.set_item(
+            intern!(py, "is_implant_displaced"),
+            self.is_implant_displaced(),
+        )?;
+        dict.set_item(
+            intern!(py, "is_spot_compression"),
+            self.is_spot_compression(),
+        )?;
+        dict.set_item(intern!(py, "is_magnified"), self.is_magnified())?;
         Ok(dict.unbind())
     }
 
@@ -247,6 +365,9 @@ impl PyMammogramRecord {
 
 impl From<crate::selection::MammogramRecord> for PyMammogramRecord {
     fn from(inner: crate::selection::MammogramRecord) -> Self {
-        Self { inner }
+        Self {
+            inner,
+            metadata: OnceLock::new(),
+        }
     }
 }
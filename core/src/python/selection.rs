@@ -2,6 +2,7 @@
 
 use pyo3::exceptions::PyUserWarning;
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
 use pyo3::types::PyDict;
 
 use super::enums::{PyMammogramView, PyPreferenceOrder};
@@ -11,7 +12,7 @@ use super::record::PyMammogramRecord;
 use crate::selection::{
     self as core_selection, MammogramRecord, SelectionWarning, StudySelectionMode,
 };
-use crate::types::{FilterConfig, MammogramView, PreferenceOrder};
+use crate::types::{FilterConfig, MammogramView, PreferenceOrder, STANDARD_MAMMO_VIEWS};
 use std::collections::HashMap;
 
 type PreferredViewSelection = HashMap<MammogramView, Option<MammogramRecord>>;
@@ -34,7 +35,7 @@ type PreferredViewSelectionWithWarnings = (PreferredViewSelection, Vec<Selection
 /// Example:
 ///     >>> from mammocat import MammogramRecord, get_preferred_views
 ///     >>> from pathlib import Path
-///     >>> records = [MammogramRecord.from_file(f) for f in Path("dicoms").glob("*.dcm")]
+///     >>> records = MammogramRecord.from_paths(Path("dicoms").glob("*.dcm"))
 ///     >>> selections = get_preferred_views(records)
 ///     >>> for view, record in selections.items():
 ///     ...     if record:
@@ -48,8 +49,9 @@ pub fn py_get_preferred_views(
     strict: bool,
 ) -> PyResult<Py<PyDict>> {
     let rust_records: Vec<_> = records.into_iter().map(|r| r.inner).collect();
-    let (result, warnings) =
-        select_unfiltered_views(&rust_records, PreferenceOrder::Default, strict)?;
+    let (result, warnings) = py.allow_threads(|| {
+        select_unfiltered_views(&rust_records, PreferenceOrder::Default, strict)
+    })?;
     emit_selection_warnings(py, &warnings)?;
     hashmap_to_py_dict(py, result)
 }
@@ -76,7 +78,7 @@ pub fn py_get_preferred_views(
 ///     ...     PreferenceOrder
 ///     ... )
 ///     >>> from pathlib import Path
-///     >>> records = [MammogramRecord.from_file(f) for f in Path("dicoms").glob("*.dcm")]
+///     >>> records = MammogramRecord.from_paths(Path("dicoms").glob("*.dcm"))
 ///     >>> selections = get_preferred_views_with_order(
 ///     ...     records,
 ///     ...     PreferenceOrder.TOMO_FIRST
@@ -94,8 +96,8 @@ pub fn py_get_preferred_views_with_order(
     strict: bool,
 ) -> PyResult<Py<PyDict>> {
     let rust_records: Vec<_> = records.into_iter().map(|r| r.inner).collect();
-    let (result, warnings) =
-        select_unfiltered_views(&rust_records, preference_order.inner, strict)?;
+    let (result, warnings) = py
+        .allow_threads(|| select_unfiltered_views(&rust_records, preference_order.inner, strict))?;
     emit_selection_warnings(py, &warnings)?;
     hashmap_to_py_dict(py, result)
 }
@@ -128,7 +130,7 @@ pub fn py_get_preferred_views_with_order(
 ///     ...     allowed_types=[MammogramType.FFDM, MammogramType.TOMO],
 ///     ...     exclude_implants=True
 ///     ... )
-///     >>> records = [MammogramRecord.from_file(f) for f in Path("dicoms").glob("*.dcm")]
+///     >>> records = MammogramRecord.from_paths(Path("dicoms").glob("*.dcm"))
 ///     >>> selections = get_preferred_views_filtered(
 ///     ...     records,
 ///     ...     config,
@@ -145,13 +147,15 @@ pub fn py_get_preferred_views_filtered(
     strict: bool,
 ) -> PyResult<Py<PyDict>> {
     let rust_records: Vec<_> = records.into_iter().map(|r| r.inner).collect();
-    let (result, warnings) =
-        core_selection::get_preferred_views_filtered_with_study_mode_and_warnings(
-            &rust_records,
-            &filter_config.inner,
-            preference_order.inner,
-            StudySelectionMode::from_strict(strict),
-        )
+    let (result, warnings) = py
+        .allow_threads(|| {
+            core_selection::get_preferred_views_filtered_with_study_mode_and_warnings(
+                &rust_records,
+                &filter_config.inner,
+                preference_order.inner,
+                StudySelectionMode::from_strict(strict),
+            )
+        })
         .map_err(convert_error)?;
 
     emit_selection_warnings(py, &warnings)?;
@@ -187,17 +191,32 @@ fn emit_selection_warnings(py: Python, warnings: &[SelectionWarning]) -> PyResul
     Ok(())
 }
 
+/// `{view: None}` for every standard view, copied as the start of each result
+static EMPTY_SELECTION: GILOnceCell<Py<PyDict>> = GILOnceCell::new();
+
 /// Convert HashMap<MammogramView, Option<MammogramRecord>> to Python dict
+///
+/// Starts from a copy of the cached all-`None` template and only fills in the
+/// views that have a selection, keyed by the interned view objects.
 fn hashmap_to_py_dict(py: Python, map: PreferredViewSelection) -> PyResult<Py<PyDict>> {
-    let dict = PyDict::new_bound(py);
+    let dict = EMPTY_SELECTION
+        .get_or_try_init(py, || -> PyResult<_> {
+            let dict = PyDict::new_bound(py);
+            for view in STANDARD_MAMMO_VIEWS {
+                dict.set_item(PyMammogramView::interned(py, view)?, py.None())?;
+            }
+            Ok(dict.unbind())
+        })?
+        .bind(py)
+        .copy()?;
 
     for (view, record) in map.into_iter() {
-        let py_view = PyMammogramView::from(view).into_py(py);
         let py_record: PyObject = match record {
             Some(r) => PyMammogramRecord::from(r).into_py(py),
+            None if STANDARD_MAMMO_VIEWS.contains(&view) => continue,
             None => py.None(),
         };
-        dict.set_item(py_view, py_record)?;
+        dict.set_item(PyMammogramView::interned(py, view)?, py_record)?;
     }
 
     Ok(dict.unbind())
@@ -1,13 +1,16 @@
 //! Utility functions for Python bindings conversions
 
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use std::borrow::Cow;
 use std::path::PathBuf;
 
-/// Converts a Python path-like object (str or pathlib.Path) to PathBuf
+/// Converts a Python path-like object (str, pathlib.Path or os.PathLike) to PathBuf
 pub fn path_to_pathbuf(path: &Bound<'_, PyAny>) -> PyResult<PathBuf> {
-    // Try to convert as string first
-    if let Ok(s) = path.extract::<String>() {
-        return Ok(PathBuf::from(s));
+    // str and os.PathLike objects, converted with os.fspath()
+    if let Ok(path_buf) = path.extract::<PathBuf>() {
+        return Ok(path_buf);
     }
 
     // Try to call __str__() for pathlib.Path objects
@@ -21,6 +24,33 @@ pub fn path_to_pathbuf(path: &Bound<'_, PyAny>) -> PyResult<PathBuf> {
     ))
 }
 
+/// Converts a str or os.PathLike object to PathBuf with os.fspath(), raising
+/// TypeError for anything else instead of falling back to `str()`
+pub fn fspath_to_pathbuf(path: &Bound<'_, PyAny>) -> PyResult<PathBuf> {
+    path.extract::<PathBuf>().map_err(|_| {
+        pyo3::exceptions::PyTypeError::new_err(format!(
+            "expected str or os.PathLike object, not {}",
+            path.get_type()
+                .name()
+                .map_or_else(|_| "object".into(), |name| name.to_string())
+        ))
+    })
+}
+
+/// Bytes of a Python `bytes` object or buffer (bytearray, memoryview, mmap) that
+/// stay valid and unchanged while the GIL is released
+///
+/// `bytes` objects are immutable, so they are borrowed without copying. Every
+/// other buffer is copied while the GIL is still held: even a read-only export,
+/// such as `memoryview(bytearray(...)).toreadonly()`, does not stop another
+/// thread from writing to the object behind it.
+pub fn buffer_bytes<'a>(py: Python<'_>, data: &'a Bound<'_, PyAny>) -> PyResult<Cow<'a, [u8]>> {
+    if let Ok(bytes) = data.downcast::<PyBytes>() {
+        return Ok(Cow::Borrowed(bytes.as_bytes()));
+    }
+    Ok(Cow::Owned(PyBuffer::<u8>::get_bound(data)?.to_vec(py)?))
+}
+
 /// Converts an Option<String> to Python (None or str)
 pub fn option_string_to_py(py: Python, opt: Option<String>) -> PyObject {
     match opt {
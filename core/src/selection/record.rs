@@ -1,13 +1,82 @@
 use crate::api::{MammogramExtractor, MammogramMetadata};
-use crate::error::Result;
+use crate::error::{MammocatError, Result};
 use crate::extraction::tags::{
-    get_string_value, get_u16_value, COLUMNS, LOSSY_IMAGE_COMPRESSION, PIXEL_DATA_TAG, ROWS,
-    SERIES_INSTANCE_UID, SOP_INSTANCE_UID, STUDY_INSTANCE_UID,
+    get_string_value, get_u16_value, COLUMNS, LOSSY_IMAGE_COMPRESSION, METADATA_READ_UNTIL_TAG,
+    ROWS, SERIES_INSTANCE_UID, SOP_INSTANCE_UID, STUDY_INSTANCE_UID,
 };
-use crate::types::PreferenceOrder;
+use crate::types::{MammogramType, PreferenceOrder};
 use dicom_object::{FileDicomObject, InMemDicomObject, OpenFileOptions};
 use std::cmp::Ordering;
-use std::path::PathBuf;
+use std::fs::File;
+use std::io::Read;
+use std::num::NonZeroUsize;
+use std::path::{Path, PathBuf};
+
+/// Read buffer size for header parsing; large enough that most headers
+/// (including vendor private groups) are read in a single system call.
+const HEADER_READ_BUFFER_SIZE: usize = 64 * 1024;
+
+/// Opens a DICOM file and reads its metadata elements.
+///
+/// Parsing stops before per-frame functional groups and pixel data, and the
+/// header is read through a 64 KiB buffer rather than the 8 KiB default, so
+/// typical headers cost one or two reads and the pixel data is never touched.
+pub(crate) fn open_metadata(path: &Path) -> Result<FileDicomObject<InMemDicomObject>> {
+    open_metadata_with_buffer(path, &mut vec![0; HEADER_READ_BUFFER_SIZE])
+}
+
+/// Like [`open_metadata`], but reads through a caller-owned buffer so a batch
+/// of files shares one allocation.
+fn open_metadata_with_buffer(
+    path: &Path,
+    buffer: &mut [u8],
+) -> Result<FileDicomObject<InMemDicomObject>> {
+    let file = File::open(path).map_err(|e| {
+        MammocatError::DicomError(format!("Could not open file '{}': {}", path.display(), e))
+    })?;
+    OpenFileOptions::new()
+        .read_until(METADATA_READ_UNTIL_TAG)
+        .from_reader(BorrowedBufReader::new(file, buffer))
+        .map_err(|e| {
+            MammocatError::DicomError(format!("Could not read file '{}': {}", path.display(), e))
+        })
+}
+
+/// Buffered reader whose buffer is borrowed rather than owned.
+struct BorrowedBufReader<'b, R> {
+    inner: R,
+    buffer: &'b mut [u8],
+    pos: usize,
+    filled: usize,
+}
+
+impl<'b, R: Read> BorrowedBufReader<'b, R> {
+    fn new(inner: R, buffer: &'b mut [u8]) -> Self {
+        Self {
+            inner,
+            buffer,
+            pos: 0,
+            filled: 0,
+        }
+    }
+}
+
+impl<R: Read> Read for BorrowedBufReader<'_, R> {
+    fn read(&mut self, out: &mut [u8]) -> std::io::Result<usize> {
+        if self.pos == self.filled {
+            // Large reads bypass the buffer entirely, as std's BufReader does
+            if out.len() >= self.buffer.len() {
+                return self.inner.read(out);
+            }
+            self.filled = self.inner.read(self.buffer)?;
+            self.pos = 0;
+        }
+        let n = out.len().min(self.filled - self.pos);
+        out[..n].copy_from_slice(&self.buffer[self.pos..self.pos + n]);
+        self.pos += n;
+        Ok(n)
+    }
+}
 
 /// Transfer syntax UIDs that imply lossy image compression.
 ///
@@ -104,7 +173,8 @@ pub struct MammogramRecord {
 impl MammogramRecord {
     /// Creates a record from a DICOM file path
     ///
-    /// Only reads DICOM metadata (headers), not pixel data, for optimal performance.
+    /// Only reads DICOM metadata (headers), not per-frame functional groups or pixel
+    /// data, for optimal performance.
     ///
     /// # Arguments
     ///
@@ -114,13 +184,82 @@ impl MammogramRecord {
     ///
     /// Result containing the MammogramRecord or an error
     pub fn from_file(path: PathBuf) -> Result<Self> {
-        // Read only metadata, stop before pixel data tag for performance
-        let dcm = OpenFileOptions::new()
-            .read_until(PIXEL_DATA_TAG)
-            .open_file(&path)?;
+        let dcm = open_metadata(&path)?;
         Self::from_file_dicom(path, &dcm)
     }
 
+    /// Creates records from DICOM file paths on the calling thread.
+    ///
+    /// Every header is read through one shared buffer, so the batch costs a
+    /// single read-buffer allocation. Use [`MammogramRecord::from_paths_parallel`]
+    /// to spread the reads over several cores instead.
+    ///
+    /// # Arguments
+    ///
+    /// * `paths` - Paths to DICOM files
+    ///
+    /// # Returns
+    ///
+    /// Result containing one MammogramRecord per path, or the error for the
+    /// first path that could not be read
+    pub fn from_paths(paths: &[PathBuf]) -> Result<Vec<Self>> {
+        let mut buffer = vec![0; HEADER_READ_BUFFER_SIZE];
+        paths
+            .iter()
+            .map(|path| {
+                let dcm = open_metadata_with_buffer(path, &mut buffer)?;
+                Self::from_file_dicom(path.clone(), &dcm)
+            })
+            .collect()
+    }
+
+    /// Creates records from many DICOM file paths on scoped worker threads.
+    ///
+    /// Files are split across up to `max_workers` threads (one per available
+    /// core when `None`), so a directory scan does not pay for each header read
+    /// sequentially. Each worker reads its share with
+    /// [`MammogramRecord::from_paths`], reusing one read buffer. Records are
+    /// returned in input order.
+    ///
+    /// # Arguments
+    ///
+    /// * `paths` - Paths to DICOM files
+    /// * `max_workers` - Upper bound on the number of worker threads
+    ///
+    /// # Returns
+    ///
+    /// Result containing one MammogramRecord per path, or the error for the
+    /// first path (in input order) that could not be read
+    pub fn from_paths_parallel(
+        paths: &[PathBuf],
+        max_workers: Option<NonZeroUsize>,
+    ) -> Result<Vec<Self>> {
+        let workers = max_workers
+            .or_else(|| std::thread::available_parallelism().ok())
+            .map_or(1, usize::from)
+            .min(paths.len());
+        if workers <= 1 {
+            return Self::from_paths(paths);
+        }
+
+        let chunk_size = paths.len().div_ceil(workers);
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = paths
+                .chunks(chunk_size)
+                .map(|chunk| scope.spawn(move || Self::from_paths(chunk)))
+                .collect();
+            let mut records = Vec::with_capacity(paths.len());
+            for handle in handles {
+                records.extend(
+                    handle
+                        .join()
+                        .unwrap_or_else(|payload| std::panic::resume_unwind(payload))?,
+                );
+            }
+            Ok(records)
+        })
+    }
+
     /// Creates a MammogramRecord from in-memory DICOM bytes.
     ///
     /// Parses the DICOM object from bytes and extracts mammogram metadata
@@ -139,7 +278,7 @@ impl MammogramRecord {
     pub fn from_bytes(bytes: &[u8], id: Option<&str>) -> Result<Self> {
         let cursor = std::io::Cursor::new(bytes);
         let dcm = OpenFileOptions::new()
-            .read_until(PIXEL_DATA_TAG)
+            .read_until(METADATA_READ_UNTIL_TAG)
             .from_reader(cursor)?;
 
         let path = id.map(PathBuf::from).unwrap_or_default();
@@ -337,6 +476,8 @@ impl MammogramRecord {
         preference_order: PreferenceOrder,
         deprioritize_lossy_compressed: bool,
     ) -> Ordering {
+        // Evaluated lazily so a pairwise comparison stops at the first
+        // deciding criterion; selection scans rank through `PreferenceKey`.
         prefer_true(
             self.metadata.is_standard_view(),
             other.metadata.is_standard_view(),
@@ -384,6 +525,113 @@ impl MammogramRecord {
     }
 }
 
+/// The fields of a record that preference ranking reads, computed once.
+///
+/// Keeps the ranking flags, type rank and image area packed next to each
+/// other so a selection scan compares a few words per candidate instead of
+/// walking view-modifier sets and re-trimming identifiers each comparison.
+/// Ties past the image area fall back to the record's identifiers.
+#[derive(Debug, Clone, Copy)]
+pub(crate) struct PreferenceKey<'a> {
+    pub(crate) record: &'a MammogramRecord,
+    study_instance_uid: Option<&'a str>,
+    type_rank: i32,
+    area: u32,
+    flags: u8,
+}
+
+impl<'a> PreferenceKey<'a> {
+    const STANDARD_VIEW: u8 = 1 << 0;
+    const DEPRIORITIZED_MODIFIER: u8 = 1 << 1;
+    const IMPLANT_DISPLACED: u8 = 1 << 2;
+    const LOSSY_COMPRESSED: u8 = 1 << 3;
+
+    pub(crate) fn new(
+        record: &'a MammogramRecord,
+        type_rank: &impl Fn(&MammogramType) -> i32,
+    ) -> Self {
+        let mut flags = 0;
+        for (set, flag) in [
+            (record.metadata.is_standard_view(), Self::STANDARD_VIEW),
+            (
+                record.has_deprioritized_view_modifier(),
+                Self::DEPRIORITIZED_MODIFIER,
+            ),
+            (record.is_implant_displaced(), Self::IMPLANT_DISPLACED),
+            (record.is_lossy_compressed, Self::LOSSY_COMPRESSED),
+        ] {
+            if set {
+                flags |= flag;
+            }
+        }
+        Self {
+            record,
+            study_instance_uid: normalized_optional_identifier(&record.study_instance_uid),
+            type_rank: type_rank(&record.metadata.mammogram_type),
+            area: record.image_area().unwrap_or(0),
+            flags,
+        }
+    }
+
+    fn has(&self, flag: u8) -> bool {
+        self.flags & flag != 0
+    }
+
+    /// Orders keys like `MammogramRecord::preference_cmp_with_options`, with the
+    /// mammogram type ranking already applied by `new`.
+    pub(crate) fn preference_cmp(
+        &self,
+        other: &PreferenceKey<'_>,
+        deprioritize_lossy_compressed: bool,
+    ) -> Ordering {
+        prefer_true(
+            self.has(Self::STANDARD_VIEW),
+            other.has(Self::STANDARD_VIEW),
+        )
+        .then_with(|| {
+            self.has(Self::DEPRIORITIZED_MODIFIER)
+                .cmp(&other.has(Self::DEPRIORITIZED_MODIFIER))
+        })
+        .then_with(
+            || match (self.study_instance_uid, other.study_instance_uid) {
+                (Some(left), Some(right)) => left.cmp(right).then_with(|| {
+                    // Implant-displaced views only win within one known study
+                    prefer_true(
+                        self.has(Self::IMPLANT_DISPLACED),
+                        other.has(Self::IMPLANT_DISPLACED),
+                    )
+                }),
+                (Some(_), None) => Ordering::Less,
+                (None, Some(_)) => Ordering::Greater,
+                (None, None) => Ordering::Equal,
+            },
+        )
+        .then_with(|| {
+            if deprioritize_lossy_compressed {
+                self.has(Self::LOSSY_COMPRESSED)
+                    .cmp(&other.has(Self::LOSSY_COMPRESSED))
+            } else {
+                Ordering::Equal
+            }
+        })
+        .then_with(|| self.type_rank.cmp(&other.type_rank))
+        .then_with(|| other.area.cmp(&self.area))
+        .then_with(|| {
+            compare_optional_identifier(
+                &self.record.sop_instance_uid,
+                &other.record.sop_instance_uid,
+            )
+        })
+        .then_with(|| {
+            compare_optional_identifier(
+                &self.record.series_instance_uid,
+                &other.record.series_instance_uid,
+            )
+        })
+        .then_with(|| self.record.file_path.cmp(&other.record.file_path))
+    }
+}
+
 fn prefer_true(left: bool, right: bool) -> Ordering {
     right.cmp(&left)
 }
@@ -560,6 +808,54 @@ mod tests {
         record
     }
 
+    #[test]
+    fn test_preference_key_matches_record_ordering() {
+        let mut records = Vec::new();
+        for (index, mammo_type) in [MammogramType::Ffdm, MammogramType::Tomo]
+            .into_iter()
+            .enumerate()
+        {
+            for study_uid in [None, Some("1.2".to_string()), Some("1.3 ".to_string())] {
+                for (implant_displaced, spot) in [(false, false), (true, false), (false, true)] {
+                    for lossy in [false, true] {
+                        let mut record = make_test_record(
+                            mammo_type,
+                            ViewPosition::Cc,
+                            Laterality::Left,
+                            Some(2560 + index as u16),
+                            Some(3328),
+                            true,
+                            implant_displaced,
+                            spot,
+                            false,
+                            study_uid.clone(),
+                            Some(format!("1.{}", records.len() % 3)),
+                        );
+                        record.is_lossy_compressed = lossy;
+                        records.push(record);
+                    }
+                }
+            }
+        }
+
+        for order in [PreferenceOrder::Default, PreferenceOrder::TomoFirst] {
+            let type_rank = |mammo_type: &MammogramType| order.preference_value(mammo_type);
+            for deprioritize in [false, true] {
+                for left in &records {
+                    for right in &records {
+                        assert_eq!(
+                            PreferenceKey::new(left, &type_rank).preference_cmp(
+                                &PreferenceKey::new(right, &type_rank),
+                                deprioritize
+                            ),
+                            left.preference_cmp_with_options(right, order, deprioritize),
+                        );
+                    }
+                }
+            }
+        }
+    }
+
     fn dicom_with_lossy_image_compression(value: &str) -> InMemDicomObject {
         let mut dcm = InMemDicomObject::new_empty();
         dcm.put(DataElement::new(
@@ -1319,6 +1615,22 @@ mod tests {
         assert!(spot.is_preferred_to(&mag)); // AAA < BBB
     }
 
+    #[test]
+    fn test_from_paths_parallel_empty() {
+        let records = MammogramRecord::from_paths_parallel(&[], None).unwrap();
+        assert!(records.is_empty());
+    }
+
+    #[test]
+    fn test_from_paths_parallel_missing_file() {
+        let paths = vec![
+            PathBuf::from("/nonexistent/a.dcm"),
+            PathBuf::from("/nonexistent/b.dcm"),
+        ];
+        assert!(MammogramRecord::from_paths_parallel(&paths, None).is_err());
+        assert!(MammogramRecord::from_paths_parallel(&paths, NonZeroUsize::new(2)).is_err());
+    }
+
     #[test]
     fn test_from_bytes_invalid_data() {
         // Invalid bytes should return an error
@@ -1346,4 +1658,54 @@ mod tests {
         // The actual path conversion is tested via Python integration tests
         // which use valid DICOM files
     }
+
+    #[test]
+    fn test_borrowed_buf_reader_preserves_bytes() {
+        let data: Vec<u8> = (0..=255u8).cycle().take(1000).collect();
+        let mut buffer = [0u8; 16];
+        let mut reader = BorrowedBufReader::new(std::io::Cursor::new(&data), &mut buffer);
+
+        // Mix reads smaller and larger than the buffer
+        let mut out = Vec::new();
+        let mut chunk = [0u8; 40];
+        for len in [1, 7, 16, 40, 3].iter().cycle() {
+            let n = reader.read(&mut chunk[..*len]).unwrap();
+            if n == 0 {
+                break;
+            }
+            out.extend_from_slice(&chunk[..n]);
+        }
+        assert_eq!(out, data);
+    }
+
+    #[test]
+    fn test_from_paths_missing_file() {
+        let result = MammogramRecord::from_paths(&[PathBuf::from("/nonexistent/file.dcm")]);
+        assert!(result.is_err());
+        assert!(MammogramRecord::from_paths(&[]).unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_header_read_errors_include_path() {
+        let missing = PathBuf::from("/nonexistent/file.dcm");
+        match open_metadata(&missing).err() {
+            Some(MammocatError::DicomError(message)) => {
+                assert!(message.contains("/nonexistent/file.dcm"), "{message}")
+            }
+            other => panic!("expected DicomError, got {other:?}"),
+        }
+
+        let temp_dir = tempfile::tempdir().unwrap();
+        let corrupt = temp_dir.path().join("corrupt.dcm");
+        std::fs::write(&corrupt, b"not a dicom file").unwrap();
+        match open_metadata(&corrupt).err() {
+            Some(MammocatError::DicomError(message)) => {
+                assert!(
+                    message.contains(&corrupt.display().to_string()),
+                    "{message}"
+                )
+            }
+            other => panic!("expected DicomError, got {other:?}"),
+        }
+    }
 }
@@ -1,15 +1,18 @@
 use crate::error::{MammocatError, Result};
-use crate::selection::record::MammogramRecord;
+use crate::selection::record::{MammogramRecord, PreferenceKey};
 use crate::types::{
     DbtObjectKind, FilterConfig, MammogramType, MammogramView, PreferenceOrder,
     STANDARD_MAMMO_VIEWS,
 };
+use std::borrow::Cow;
 use std::cmp::Ordering;
 use std::collections::{BTreeMap, HashMap, HashSet};
 use std::path::PathBuf;
 
 const MIXED_STUDY_WARNING_PREFIX: &str = "mixed study input detected";
 const SPLIT_SLICE_SERIES_COUNT_THRESHOLD: usize = 12;
+/// Below this many records per worker, ranking on one thread beats spawning more.
+const PARALLEL_SELECTION_MIN_RECORDS_PER_WORKER: usize = 4096;
 
 /// Study handling policy for preferred-view selection.
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -141,7 +144,7 @@ pub fn get_preferred_views_with_order_and_warnings(
     records: &[MammogramRecord],
     preference_order: PreferenceOrder,
 ) -> PreferredViewSelectionWithWarnings {
-    let refined_records = refine_dbt_object_classification(records);
+    let (refined_records, _) = refine_dbt_object_classification_borrowed(records);
     let selected_study =
         select_study_records(&refined_records, StudySelectionMode::MostComplete, false)
             .expect("most-complete study selection should not fail");
@@ -155,31 +158,139 @@ fn select_preferred_views_for_records(
     preference_order: PreferenceOrder,
     deprioritize_lossy_compressed: bool,
 ) -> PreferredViewSelection {
-    let mut result = HashMap::with_capacity(STANDARD_MAMMO_VIEWS.len());
+    // Dispatch on the preference order once, so each arm instantiates the ranking
+    // loop with a fixed type ranking instead of re-matching the order per comparison.
+    let best = match preference_order {
+        PreferenceOrder::Default => best_record_per_view(
+            records,
+            |mammo_type| PreferenceOrder::Default.preference_value(mammo_type),
+            deprioritize_lossy_compressed,
+        ),
+        PreferenceOrder::TomoFirst => best_record_per_view(
+            records,
+            |mammo_type| PreferenceOrder::TomoFirst.preference_value(mammo_type),
+            deprioritize_lossy_compressed,
+        ),
+        PreferenceOrder::Synthetic2dFirst => best_record_per_view(
+            records,
+            |mammo_type| PreferenceOrder::Synthetic2dFirst.preference_value(mammo_type),
+            deprioritize_lossy_compressed,
+        ),
+    };
 
-    // Try each standard view
-    for standard_view in STANDARD_MAMMO_VIEWS.iter() {
-        // Select most preferred from candidates using the specified preference order
-        let selection = records
-            .iter()
-            .filter(|record| is_candidate_for_view(record, standard_view))
-            .min_by(|a, b| {
-                compare_record_preference(a, b, preference_order, deprioritize_lossy_compressed)
+    STANDARD_MAMMO_VIEWS
+        .iter()
+        .zip(best)
+        .map(|(standard_view, selection)| (*standard_view, selection.cloned()))
+        .collect()
+}
+
+/// Most preferred record for each entry of [`STANDARD_MAMMO_VIEWS`], by slot.
+type BestRecordPerView<'a> = [Option<&'a MammogramRecord>; STANDARD_MAMMO_VIEWS.len()];
+
+type BestKeyPerView<'a> = [Option<PreferenceKey<'a>>; STANDARD_MAMMO_VIEWS.len()];
+
+fn best_record_per_view<R>(
+    records: &[MammogramRecord],
+    type_rank: R,
+    deprioritize_lossy_compressed: bool,
+) -> BestRecordPerView<'_>
+where
+    R: Fn(&MammogramType) -> i32 + Copy + Send,
+{
+    // Typical inputs are a handful of records; decide on the sequential scan
+    // before asking the OS for the core count, which reads cgroup files on Linux.
+    let max_useful_workers = records.len() / PARALLEL_SELECTION_MIN_RECORDS_PER_WORKER;
+    let workers = if max_useful_workers <= 1 {
+        1
+    } else {
+        std::thread::available_parallelism()
+            .map(usize::from)
+            .unwrap_or(1)
+            .min(max_useful_workers)
+    };
+    best_key_per_view_with_workers(records, type_rank, deprioritize_lossy_compressed, workers)
+        .map(|key| key.map(|key| key.record))
+}
+
+/// Reduces `records` to the best key per view on up to `workers` scoped threads.
+fn best_key_per_view_with_workers<R>(
+    records: &[MammogramRecord],
+    type_rank: R,
+    deprioritize_lossy_compressed: bool,
+    workers: usize,
+) -> BestKeyPerView<'_>
+where
+    R: Fn(&MammogramType) -> i32 + Copy + Send,
+{
+    let workers = workers.min(records.len());
+    if workers <= 1 {
+        return scan_best_key_per_view(records, type_rank, deprioritize_lossy_compressed);
+    }
+
+    // Each worker reduces a contiguous chunk; merging the partial results in
+    // chunk order keeps the same winner a sequential scan would pick.
+    let chunk_size = records.len().div_ceil(workers);
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = records
+            .chunks(chunk_size)
+            .map(|chunk| {
+                scope.spawn(move || {
+                    scan_best_key_per_view(chunk, type_rank, deprioritize_lossy_compressed)
+                })
             })
-            .cloned();
-        result.insert(*standard_view, selection);
-    }
+            .collect();
+        let mut best = [None; STANDARD_MAMMO_VIEWS.len()];
+        for handle in handles {
+            let partial = handle
+                .join()
+                .unwrap_or_else(|payload| std::panic::resume_unwind(payload));
+            for (slot, key) in partial.into_iter().enumerate() {
+                if let Some(key) = key {
+                    keep_preferred_key(&mut best, slot, key, deprioritize_lossy_compressed);
+                }
+            }
+        }
+        best
+    })
+}
 
-    result
+fn scan_best_key_per_view(
+    records: &[MammogramRecord],
+    type_rank: impl Fn(&MammogramType) -> i32,
+    deprioritize_lossy_compressed: bool,
+) -> BestKeyPerView<'_> {
+    let mut best = [None; STANDARD_MAMMO_VIEWS.len()];
+    for record in records {
+        // A record is a candidate for at most one standard view, so bucketing each
+        // record by slot and keeping the running best per slot is equivalent to
+        // filtering the full input once per view.
+        let Some(slot) = standard_view_slot(record) else {
+            continue;
+        };
+        let key = PreferenceKey::new(record, &type_rank);
+        keep_preferred_key(&mut best, slot, key, deprioritize_lossy_compressed);
+    }
+    best
 }
 
-fn compare_record_preference(
-    a: &MammogramRecord,
-    b: &MammogramRecord,
-    preference_order: PreferenceOrder,
+/// Records the candidate in its standard-view slot if it beats the incumbent.
+///
+/// Only a strictly preferred record replaces the incumbent, keeping the first of
+/// equally preferred records as `min_by` would. The incumbent's key is kept, so
+/// each record's ranking fields are computed once per scan.
+fn keep_preferred_key<'a>(
+    best: &mut BestKeyPerView<'a>,
+    slot: usize,
+    candidate: PreferenceKey<'a>,
     deprioritize_lossy_compressed: bool,
-) -> Ordering {
-    a.preference_cmp_with_options(b, preference_order, deprioritize_lossy_compressed)
+) {
+    let replace = best[slot].is_none_or(|current| {
+        candidate.preference_cmp(&current, deprioritize_lossy_compressed) == Ordering::Less
+    });
+    if replace {
+        best[slot] = Some(candidate);
+    }
 }
 
 /// Selects preferred inference views from a filtered collection of mammogram records
@@ -259,7 +370,7 @@ pub fn get_preferred_views_filtered_with_study_mode_and_warnings(
     preference_order: PreferenceOrder,
     study_selection_mode: StudySelectionMode,
 ) -> Result<PreferredViewSelectionWithWarnings> {
-    let refined_records = refine_dbt_object_classification(records);
+    let (refined_records, _) = refine_dbt_object_classification_borrowed(records);
     get_preferred_views_filtered_refined_with_study_mode_and_warnings(
         &refined_records,
         filter_config,
@@ -322,8 +433,22 @@ pub fn refine_dbt_object_classification(records: &[MammogramRecord]) -> Vec<Mamm
 pub fn refine_dbt_object_classification_with_diagnostics(
     records: &[MammogramRecord],
 ) -> (Vec<MammogramRecord>, Vec<DbtRefinementDiagnostic>) {
-    let mut refined_records = records.to_vec();
+    let (refined_records, diagnostics) = refine_dbt_object_classification_borrowed(records);
+    (refined_records.into_owned(), diagnostics)
+}
+
+/// Refines DBT classifications, borrowing the input when nothing changes.
+///
+/// Refinement only applies to ambiguous DBT records, which most inputs do not
+/// contain, so selection can skip copying the whole record list in that case.
+fn refine_dbt_object_classification_borrowed(
+    records: &[MammogramRecord],
+) -> (Cow<'_, [MammogramRecord]>, Vec<DbtRefinementDiagnostic>) {
+    let mut refined_records = Cow::Borrowed(records);
     let mut diagnostics = Vec::new();
+    if !records.iter().any(is_ambiguous_dbt_record) {
+        return (refined_records, diagnostics);
+    }
     let series_infos = build_series_infos(records);
     let split_slice_series = split_slice_series_keys_from_cardinality(&series_infos);
 
@@ -337,7 +462,7 @@ pub fn refine_dbt_object_classification_with_diagnostics(
 
         if split_slice_series.contains(&series_key) {
             refine_record_with_diagnostic(
-                &mut refined_records[index],
+                &mut refined_records.to_mut()[index],
                 MammogramType::Tomo,
                 DbtObjectKind::Slice,
                 DbtRefinementReason::SplitSliceSeriesCardinality,
@@ -951,9 +1076,14 @@ fn is_candidate_for_view(record: &MammogramRecord, target: &MammogramView) -> bo
 }
 
 fn is_candidate_for_any_standard_view(record: &MammogramRecord) -> bool {
+    standard_view_slot(record).is_some()
+}
+
+/// Index into [`STANDARD_MAMMO_VIEWS`] of the view this record is a candidate for.
+fn standard_view_slot(record: &MammogramRecord) -> Option<usize> {
     STANDARD_MAMMO_VIEWS
         .iter()
-        .any(|standard_view| is_candidate_for_view(record, standard_view))
+        .position(|standard_view| is_candidate_for_view(record, standard_view))
 }
 
 #[cfg(test)]
@@ -1140,6 +1270,79 @@ mod tests {
         record
     }
 
+    #[test]
+    fn test_parallel_best_key_per_view_matches_sequential_scan() {
+        let mammo_types = [
+            MammogramType::Ffdm,
+            MammogramType::Synth,
+            MammogramType::Tomo,
+            MammogramType::Sfm,
+        ];
+        // Equally preferred records repeat across chunks, so the merge must keep
+        // the first of them to agree with the sequential scan.
+        let records: Vec<_> = (0..97)
+            .map(|index| {
+                let laterality = if index % 2 == 0 {
+                    Laterality::Left
+                } else {
+                    Laterality::Right
+                };
+                let view_position = if index % 3 == 0 {
+                    ViewPosition::Cc
+                } else {
+                    ViewPosition::Mlo
+                };
+                make_test_record(laterality, view_position, mammo_types[index % 4])
+            })
+            .collect();
+
+        for preference_order in [
+            PreferenceOrder::Default,
+            PreferenceOrder::TomoFirst,
+            PreferenceOrder::Synthetic2dFirst,
+        ] {
+            let type_rank =
+                |mammo_type: &MammogramType| preference_order.preference_value(mammo_type);
+            let sequential = scan_best_key_per_view(&records, type_rank, true);
+            for workers in [2, 3, 4, 7, records.len(), records.len() + 1] {
+                let parallel = best_key_per_view_with_workers(&records, type_rank, true, workers);
+                for (selected, expected) in parallel.into_iter().zip(sequential) {
+                    assert!(std::ptr::eq(
+                        selected.unwrap().record,
+                        expected.unwrap().record
+                    ));
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_standard_view_slot_matches_candidate_filter() {
+        let positions = [
+            ViewPosition::Mlo,
+            ViewPosition::Ml,
+            ViewPosition::Lmo,
+            ViewPosition::Lm,
+            ViewPosition::Cc,
+            ViewPosition::Xccl,
+            ViewPosition::Xccm,
+            ViewPosition::Unknown,
+        ];
+        for laterality in [Laterality::Left, Laterality::Right, Laterality::Unknown] {
+            for view_position in positions {
+                let record = make_test_record(laterality, view_position, MammogramType::Ffdm);
+                let candidates: Vec<usize> = STANDARD_MAMMO_VIEWS
+                    .iter()
+                    .enumerate()
+                    .filter(|(_, view)| is_candidate_for_view(&record, view))
+                    .map(|(index, _)| index)
+                    .collect();
+                assert!(candidates.len() <= 1);
+                assert_eq!(standard_view_slot(&record), candidates.first().copied());
+            }
+        }
+    }
+
     #[test]
     fn test_is_candidate_for_view_laterality_match() {
         let l_mlo_view = MammogramView::new(Laterality::Left, ViewPosition::Mlo);
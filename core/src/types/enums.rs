@@ -63,6 +63,7 @@ impl PreferenceOrder {
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Default)]
 #[cfg_attr(feature = "json", derive(serde::Serialize, serde::Deserialize))]
 #[cfg_attr(feature = "json", serde(rename_all = "lowercase"))]
+#[repr(u8)]
 pub enum DbtObjectKind {
     /// Not a DBT object.
     #[default]
@@ -101,6 +102,7 @@ impl fmt::Display for DbtObjectKind {
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
 #[cfg_attr(feature = "json", derive(serde::Serialize, serde::Deserialize))]
 #[cfg_attr(feature = "json", serde(rename_all = "lowercase"))]
+#[repr(u8)]
 pub enum MammogramType {
     Unknown,
     Tomo,
@@ -220,6 +222,7 @@ impl fmt::Display for MammogramType {
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
 #[cfg_attr(feature = "json", derive(serde::Serialize))]
 #[cfg_attr(feature = "json", serde(rename_all = "lowercase"))]
+#[repr(u8)]
 pub enum Laterality {
     Unknown,
     None,
@@ -337,6 +340,7 @@ impl fmt::Display for Laterality {
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, PartialOrd, Ord)]
 #[cfg_attr(feature = "json", derive(serde::Serialize))]
 #[cfg_attr(feature = "json", serde(rename_all = "lowercase"))]
+#[repr(u8)]
 pub enum ViewPosition {
     Unknown,
     Xccl,
@@ -407,6 +411,7 @@ impl ViewPosition {
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, PartialOrd, Ord)]
 #[cfg_attr(feature = "json", derive(serde::Serialize))]
 #[cfg_attr(feature = "json", serde(rename_all = "snake_case"))]
+#[repr(u8)]
 pub enum MammographyViewModifier {
     Cleavage,
     AxillaryTail,
@@ -559,6 +564,15 @@ mod tests {
         assert_eq!(DbtObjectKind::Unknown.to_string(), "unknown");
     }
 
+    #[test]
+    fn test_metadata_enums_are_one_byte() {
+        assert_eq!(std::mem::size_of::<MammogramType>(), 1);
+        assert_eq!(std::mem::size_of::<DbtObjectKind>(), 1);
+        assert_eq!(std::mem::size_of::<Laterality>(), 1);
+        assert_eq!(std::mem::size_of::<ViewPosition>(), 1);
+        assert_eq!(std::mem::size_of::<MammographyViewModifier>(), 1);
+    }
+
     #[test]
     fn test_mammogram_type_ordering() {
         assert!(MammogramType::Tomo < MammogramType::Ffdm);
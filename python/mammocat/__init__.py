@@ -17,7 +17,7 @@ Example:
 
     >>> from mammocat import MammogramRecord, get_preferred_views
     >>> from pathlib import Path
-    >>> records = [MammogramRecord.from_file(f) for f in Path("dicoms").glob("*.dcm")]
+    >>> records = MammogramRecord.from_paths(Path("dicoms").glob("*.dcm"))
     >>> selections = get_preferred_views(records)
 """
 
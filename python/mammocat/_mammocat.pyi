@@ -1,5 +1,8 @@
 """Type stubs for the mammocat Rust extension module."""
 
+from collections.abc import Iterable
+from mmap import mmap
+from os import PathLike
 from pathlib import Path
 from typing import Any, Literal
 
@@ -284,7 +287,13 @@ class MammogramRecord:
     @staticmethod
     def from_file(path: str | Path) -> MammogramRecord: ...
     @staticmethod
-    def from_bytes(data: bytes, id: str | None = None) -> MammogramRecord: ...
+    def from_paths(
+        paths: Iterable[str | PathLike[str]], *, max_workers: int | None = None
+    ) -> list[MammogramRecord]: ...
+    @staticmethod
+    def from_bytes(
+        data: bytes | bytearray | memoryview | mmap, id: str | None = None
+    ) -> MammogramRecord: ...
     @property
     def file_path(self) -> str: ...
     @property
@@ -323,11 +332,13 @@ class MammogramRecord:
 class MammogramExtractor:
     """Main extractor for mammography metadata from DICOM files."""
     @staticmethod
-    def extract_from_file(path: str | Path) -> MammogramMetadata: ...
+    def extract_from_file(path: str | Path, *, cache: bool = False) -> MammogramMetadata: ...
     @staticmethod
     def extract_from_file_with_options(
-        path: str | Path, is_sfm: bool = False
+        path: str | Path, is_sfm: bool = False, *, cache: bool = False
     ) -> MammogramMetadata: ...
+    @staticmethod
+    def clear_cache() -> None: ...
 
 def validate_dicom(
     path: str | Path,
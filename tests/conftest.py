@@ -1,12 +1,21 @@
 """Pytest configuration and fixtures for mammocat tests."""
 
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import pytest
-from pydicom.dataset import Dataset
-from pydicom.uid import ExplicitVRLittleEndian
+
+# pydicom is imported inside the factories so that collecting test modules
+# which never build a DICOM file (e.g. the enum tests) does not import it.
+if TYPE_CHECKING:
+    from pydicom.dataset import Dataset
 
 BREAST_TOMOSYNTHESIS_SOP_CLASS_UID = "1.2.840.10008.5.1.4.1.1.13.1.3"
 CT_IMAGE_STORAGE_SOP_CLASS_UID = "1.2.840.10008.5.1.4.1.1.2"
 DIGITAL_MAMMOGRAPHY_SOP_CLASS_UID = "1.2.840.10008.5.1.4.1.1.1.2"
+EXPLICIT_VR_LITTLE_ENDIAN = "1.2.840.10008.1.2.1"
 
 VIEW_CODES = {
     "CC": ("399162004", "cranio-caudal"),
@@ -44,7 +53,7 @@ def create_mammogram_dicom(
     is_implant_displaced: bool = False,
     nested_view_modifiers: bool = False,
     pixel_spacing: tuple[float, float] | None = (0.07, 0.07),
-    transfer_syntax_uid: str = ExplicitVRLittleEndian,
+    transfer_syntax_uid: str = EXPLICIT_VR_LITTLE_ENDIAN,
     lossy_image_compression: str = "00",
 ) -> Dataset:
     """Create a synthetic mammography DICOM dataset.
@@ -70,6 +79,8 @@ def create_mammogram_dicom(
     Returns:
         A pydicom Dataset with mammography metadata
     """
+    from pydicom.dataset import Dataset
+
     # Create file meta information
     file_meta = Dataset()
     file_meta.TransferSyntaxUID = transfer_syntax_uid
@@ -170,6 +181,25 @@ def create_mammogram_dicom(
     return ds
 
 
+@lru_cache(maxsize=None)
+def mammogram_dicom_bytes(**kwargs) -> bytes:
+    """Serialize a synthetic mammogram once per unique set of arguments.
+
+    Accepts the same keyword arguments as ``create_mammogram_dicom``.
+    """
+    from pydicom.filebase import DicomBytesIO
+
+    buffer = DicomBytesIO()
+    create_mammogram_dicom(**kwargs).save_as(buffer, enforce_file_format=True)
+    return buffer.getvalue()
+
+
+def write_mammogram_dicom(path, **kwargs):
+    """Write a cached synthetic mammogram to ``path`` and return the path."""
+    path.write_bytes(mammogram_dicom_bytes(**kwargs))
+    return path
+
+
 def create_old_format_dbt_slice(
     *,
     study_uid: str = "1.2.826.0.1.3680043.10.543.1",
@@ -184,8 +214,10 @@ def create_old_format_dbt_slice(
     pixel_value: int | None = None,
 ) -> Dataset:
     """Create one old-format DBT slice stored as a single-frame CT-like DICOM."""
+    from pydicom.dataset import Dataset
+
     file_meta = Dataset()
-    file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    file_meta.TransferSyntaxUID = EXPLICIT_VR_LITTLE_ENDIAN
     file_meta.MediaStorageSOPClassUID = CT_IMAGE_STORAGE_SOP_CLASS_UID
     file_meta.MediaStorageSOPInstanceUID = sop_uid
 
@@ -288,23 +320,22 @@ def mammogram_dicom_factory():
 @pytest.fixture
 def sample_dicom(fixtures_dir):
     """Creates and returns a sample FFDM DICOM file."""
-    dicom_path = fixtures_dir / "sample_ffdm_l_mlo.dcm"
-    ds = create_mammogram_dicom(
+    dicom_path = write_mammogram_dicom(
+        fixtures_dir / "sample_ffdm_l_mlo.dcm",
         mammogram_type="FFDM",
         laterality="L",
         view_position="MLO",
         rows=2048,
         columns=1536,
     )
-    ds.save_as(dicom_path, enforce_file_format=True)
     return str(dicom_path)
 
 
 @pytest.fixture
 def lossy_dicom(fixtures_dir):
     """Creates and returns a sample DICOM file marked as lossy compressed."""
-    dicom_path = fixtures_dir / "lossy_ffdm_l_mlo.dcm"
-    ds = create_mammogram_dicom(
+    dicom_path = write_mammogram_dicom(
+        fixtures_dir / "lossy_ffdm_l_mlo.dcm",
         mammogram_type="FFDM",
         laterality="L",
         view_position="MLO",
@@ -312,7 +343,6 @@ def lossy_dicom(fixtures_dir):
         columns=1536,
         lossy_image_compression="01",
     )
-    ds.save_as(dicom_path, enforce_file_format=True)
     return str(dicom_path)
 
 
@@ -332,69 +362,63 @@ def sample_dicom_set(fixtures_dir):
 
     # Standard 4-view FFDM screening set
     for laterality, view in [("L", "MLO"), ("R", "MLO"), ("L", "CC"), ("R", "CC")]:
-        path = fixtures_dir / f"ffdm_{laterality.lower()}_{view.lower()}.dcm"
-        ds = create_mammogram_dicom(
+        path = write_mammogram_dicom(
+            fixtures_dir / f"ffdm_{laterality.lower()}_{view.lower()}.dcm",
             mammogram_type="FFDM",
             laterality=laterality,
             view_position=view,
         )
-        ds.save_as(path, enforce_file_format=True)
         dicom_files.append(path)
 
     # TOMO images
     for laterality, view in [("L", "MLO"), ("R", "CC")]:
-        path = fixtures_dir / f"tomo_{laterality.lower()}_{view.lower()}.dcm"
-        ds = create_mammogram_dicom(
+        path = write_mammogram_dicom(
+            fixtures_dir / f"tomo_{laterality.lower()}_{view.lower()}.dcm",
             mammogram_type="TOMO",
             laterality=laterality,
             view_position=view,
         )
-        ds.save_as(path, enforce_file_format=True)
         dicom_files.append(path)
 
     # SYNTH (synthetic 2D from TOMO)
-    path = fixtures_dir / "synth_l_mlo.dcm"
-    ds = create_mammogram_dicom(
+    path = write_mammogram_dicom(
+        fixtures_dir / "synth_l_mlo.dcm",
         mammogram_type="SYNTH",
         laterality="L",
         view_position="MLO",
     )
-    ds.save_as(path, enforce_file_format=True)
     dicom_files.append(path)
 
     # Special views
     # Spot compression
-    path = fixtures_dir / "ffdm_l_cc_spot.dcm"
-    ds = create_mammogram_dicom(
+    path = write_mammogram_dicom(
+        fixtures_dir / "ffdm_l_cc_spot.dcm",
         mammogram_type="FFDM",
         laterality="L",
         view_position="CC",
         is_spot_compression=True,
     )
-    ds.save_as(path, enforce_file_format=True)
     dicom_files.append(path)
 
     # Magnified view
-    path = fixtures_dir / "ffdm_r_mlo_mag.dcm"
-    ds = create_mammogram_dicom(
+    path = write_mammogram_dicom(
+        fixtures_dir / "ffdm_r_mlo_mag.dcm",
         mammogram_type="FFDM",
         laterality="R",
         view_position="MLO",
         is_magnified=True,
     )
-    ds.save_as(path, enforce_file_format=True)
     dicom_files.append(path)
 
     # Implant displaced
-    path = fixtures_dir / "ffdm_l_cc_implant_displaced.dcm"
-    ds = create_mammogram_dicom(
+    path = write_mammogram_dicom(
+        fixtures_dir / "ffdm_l_cc_implant_displaced.dcm",
         mammogram_type="FFDM",
         laterality="L",
         view_position="CC",
         has_implant=True,
         is_implant_displaced=True,
     )
-    ds.save_as(path, enforce_file_format=True)
     dicom_files.append(path)
 
     return dicom_files
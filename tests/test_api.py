@@ -1,8 +1,11 @@
 """Tests for mammocat main API (requires DICOM fixtures)."""
 
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
+from pydicom.dataset import Dataset
 
 from mammocat import (
     DbtObjectKind,
@@ -77,6 +80,62 @@ class TestMammogramExtractor:
         with pytest.raises((DicomError, IOError)):
             MammogramExtractor.extract_from_file("/nonexistent/file.dcm")
 
+    def test_extract_from_file_cache_respects_options(self, sample_dicom):
+        """Test cached results are not shared between different is_sfm values."""
+        ffdm = MammogramExtractor.extract_from_file(sample_dicom, cache=True)
+        sfm = MammogramExtractor.extract_from_file_with_options(
+            sample_dicom, is_sfm=True, cache=True
+        )
+
+        assert ffdm.mammogram_type == MammogramType.FFDM
+        assert sfm.mammogram_type == MammogramType.SFM
+        cached = MammogramExtractor.extract_from_file(sample_dicom, cache=True)
+        assert cached.to_dict() == ffdm.to_dict()
+
+    def test_extract_from_file_rereads_modified_file(self, fixtures_dir, mammogram_dicom_factory):
+        """Test a file rewritten in place with the same size is read again."""
+        path = fixtures_dir / "rewritten.dcm"
+        mammogram_dicom_factory(laterality="L").save_as(path, enforce_file_format=True)
+        before = MammogramExtractor.extract_from_file(path)
+        size = path.stat().st_size
+
+        mammogram_dicom_factory(laterality="R").save_as(path, enforce_file_format=True)
+        after = MammogramExtractor.extract_from_file(path)
+
+        assert path.stat().st_size == size
+        assert str(before.laterality) == "left"
+        assert str(after.laterality) == "right"
+
+    def test_extract_from_file_cache_rereads_resized_file(
+        self, fixtures_dir, mammogram_dicom_factory
+    ):
+        """Test cached extraction rereads a file rewritten with a different size."""
+        path = fixtures_dir / "cached_rewrite.dcm"
+        ds = mammogram_dicom_factory()
+        ds.Manufacturer = "Vendor"
+        ds.save_as(path, enforce_file_format=True)
+        before = MammogramExtractor.extract_from_file(path, cache=True)
+
+        # A longer value changes the file size, which is part of the cache key
+        ds.Manufacturer = "Another Vendor"
+        ds.save_as(path, enforce_file_format=True)
+        after = MammogramExtractor.extract_from_file(path, cache=True)
+
+        assert before.manufacturer == "Vendor"
+        assert after.manufacturer == "Another Vendor"
+
+        MammogramExtractor.clear_cache()
+        reread = MammogramExtractor.extract_from_file(path, cache=True)
+        assert reread.manufacturer == "Another Vendor"
+
+    def test_clear_cache(self, sample_dicom):
+        """Test clearing the extraction cache keeps extraction working."""
+        before = MammogramExtractor.extract_from_file(sample_dicom, cache=True)
+        MammogramExtractor.clear_cache()
+
+        after = MammogramExtractor.extract_from_file(sample_dicom, cache=True)
+        assert after.to_dict() == before.to_dict()
+
     def test_extract_with_options(self, sample_dicom):
         """Test extraction with SFM option."""
         metadata = MammogramExtractor.extract_from_file_with_options(sample_dicom, is_sfm=False)
@@ -98,6 +157,14 @@ class TestMammogramExtractor:
         # Test is_standard_view method
         assert isinstance(metadata.is_standard_view(), bool)
 
+    def test_mammogram_view_is_shared_with_selection_keys(self, sample_dicom):
+        """Test standard views are handed out as shared instances."""
+        metadata = MammogramExtractor.extract_from_file(sample_dicom)
+        view = metadata.mammogram_view()
+
+        assert view is metadata.mammogram_view()
+        assert any(key is view for key in get_preferred_views([]))
+
     def test_metadata_to_dict(self, sample_dicom):
         """Test metadata to_dict conversion."""
         metadata = MammogramExtractor.extract_from_file(sample_dicom)
@@ -208,6 +275,29 @@ class TestMammogramExtractor:
         assert metadata_dict["mammogram_type"] == "tomo"
         assert metadata_dict["dbt_object_kind"] == "slice"
 
+    def test_extraction_ignores_per_frame_groups_and_pixel_data(
+        self, fixtures_dir, mammogram_dicom_factory
+    ):
+        """Test metadata reads stop before per-frame functional groups and pixel data."""
+        dicom_path = fixtures_dir / "tomo_with_frames.dcm"
+        ds = mammogram_dicom_factory(mammogram_type="TOMO", rows=4, columns=3)
+        ds.PerFrameFunctionalGroupsSequence = [Dataset() for _ in range(ds.NumberOfFrames)]
+        ds.PixelData = b"\x00\x00" * 4 * 3 * ds.NumberOfFrames
+        ds.save_as(dicom_path, enforce_file_format=True)
+        # Cut the file off inside the first sequence item, just past the explicit
+        # VR little endian (5200,9230) SQ header, so any reader that parses the
+        # per-frame groups runs into the end of the file.
+        contents = dicom_path.read_bytes()
+        sequence_header = contents.index(b"\x00\x52\x30\x92SQ\x00\x00")
+        dicom_path.write_bytes(contents[: sequence_header + 12 + 4])
+
+        metadata = MammogramExtractor.extract_from_file(dicom_path)
+        record = MammogramRecord.from_file(dicom_path)
+
+        assert metadata.mammogram_type == MammogramType.TOMO
+        assert metadata.number_of_frames == 50
+        assert record.image_area() == 12
+
     def test_nested_view_modifiers_match_top_level_encoding(
         self, fixtures_dir, mammogram_dicom_factory
     ):
@@ -253,6 +343,69 @@ class TestMammogramRecord:
         assert record.file_path is not None
         assert record.metadata is not None
 
+    def test_from_paths(self, sample_dicom_set):
+        """Test batch record creation matches per-file creation in input order."""
+        records = MammogramRecord.from_paths(sample_dicom_set)
+
+        assert len(records) == len(sample_dicom_set)
+        for record, path in zip(records, sample_dicom_set, strict=True):
+            expected = MammogramRecord.from_file(path)
+            assert record.file_path == str(path)
+            assert record.metadata.mammogram_type == expected.metadata.mammogram_type
+            assert record.metadata.laterality == expected.metadata.laterality
+            assert record.metadata.view_position == expected.metadata.view_position
+
+    def test_from_paths_empty(self):
+        """Test batch record creation with no paths."""
+        assert MammogramRecord.from_paths([]) == []
+
+    @pytest.mark.parametrize("max_workers", [1, 2, 64])
+    def test_from_paths_max_workers(self, sample_dicom_set, max_workers):
+        """Test every worker count returns the same records in input order."""
+        records = MammogramRecord.from_paths(sample_dicom_set, max_workers=max_workers)
+
+        assert [r.file_path for r in records] == [str(p) for p in sample_dicom_set]
+
+    def test_from_paths_rejects_zero_workers(self, sample_dicom_set):
+        """Test max_workers must allow at least one reader thread."""
+        with pytest.raises(ValueError, match="max_workers"):
+            MammogramRecord.from_paths(sample_dicom_set, max_workers=0)
+
+    def test_from_paths_rejects_single_string(self, sample_dicom):
+        """Test a bare string is not treated as an iterable of paths."""
+        with pytest.raises(TypeError):
+            MammogramRecord.from_paths(sample_dicom)
+
+    def test_from_paths_rejects_non_path_items(self):
+        """Test items that are neither str nor os.PathLike raise TypeError."""
+        with pytest.raises(TypeError, match="int"):
+            MammogramRecord.from_paths([1, 2])
+
+    def test_from_paths_missing_file(self, sample_dicom):
+        """Test batch record creation fails when any path cannot be read."""
+        with pytest.raises(DicomError, match="/nonexistent/file.dcm"):
+            MammogramRecord.from_paths([sample_dicom, "/nonexistent/file.dcm"])
+
+    def test_from_paths_corrupt_file_error_names_file(self, tmp_path):
+        """Test header parse errors name the file that could not be read."""
+        corrupt = tmp_path / "corrupt.dcm"
+        corrupt.write_bytes(b"not a dicom file")
+        with pytest.raises(DicomError, match="corrupt.dcm"):
+            MammogramRecord.from_paths([corrupt])
+
+    def test_from_file_in_thread_pool(self, sample_dicom_set):
+        """Test from_file can be called concurrently from Python threads."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            records = list(executor.map(MammogramRecord.from_file, sample_dicom_set))
+
+        assert [record.file_path for record in records] == [str(p) for p in sample_dicom_set]
+
+    def test_metadata_is_cached(self, sample_dicom):
+        """Test repeated metadata access returns the same object."""
+        record = MammogramRecord.from_file(sample_dicom)
+
+        assert record.metadata is record.metadata
+
     def test_record_properties(self, sample_dicom):
         """Test record property access."""
         record = MammogramRecord.from_file(sample_dicom)
@@ -326,6 +479,30 @@ class TestMammogramRecordFromBytes:
         assert record.file_path == ""
         assert record.metadata is not None
 
+    def test_from_bytes_accepts_buffers(self, sample_dicom):
+        """Test from_bytes parses bytearray, memoryview, read-only, strided, and mmap buffers."""
+        expected = MammogramRecord.from_file(sample_dicom)
+        data = Path(sample_dicom).read_bytes()
+
+        with Path(sample_dicom).open("rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            # Buffers other than bytes are copied before parsing
+            interleaved = bytearray(len(data) * 2)
+            interleaved[::2] = data
+            buffers = [
+                bytearray(data),
+                memoryview(data),
+                memoryview(bytearray(data)).toreadonly(),
+                mapped,
+                memoryview(interleaved)[::2],
+            ]
+            for buffer in buffers:
+                record = MammogramRecord.from_bytes(buffer, id="buffer_upload")
+                assert record.metadata.mammogram_type == expected.metadata.mammogram_type
+                assert record.rows == expected.rows
+                assert record.columns == expected.columns
+
     def test_from_bytes_matches_from_file(self, sample_dicom):
         """Test that from_bytes produces same metadata as from_file."""
         record_file = MammogramRecord.from_file(sample_dicom)
@@ -372,12 +549,14 @@ class TestMammogramRecordFromBytes:
 
     def test_from_bytes_in_view_selection(self, sample_dicom_set):
         """Test that records from from_bytes work in view selection."""
-        # Load files as bytes and create records
+        # Read every upload into one reusable buffer; records do not keep
+        # a reference to the bytes they were parsed from
+        buffer = bytearray(max(Path(p).stat().st_size for p in sample_dicom_set))
         records = []
         for i, filepath in enumerate(sample_dicom_set):
             with Path(filepath).open("rb") as f:
-                data = f.read()
-            record = MammogramRecord.from_bytes(data, id=f"upload_{i}")
+                size = f.readinto(buffer)
+            record = MammogramRecord.from_bytes(memoryview(buffer)[:size], id=f"upload_{i}")
             records.append(record)
 
         # Should work with view selection
@@ -405,10 +584,22 @@ class TestPreferredViews:
         assert len(result) == 4
         assert all(v is None for v in result.values())
 
+    def test_get_preferred_views_returns_fresh_dict(self, sample_dicom_set):
+        """Test that mutating one result does not leak into later results."""
+        records = [MammogramRecord.from_file(str(f)) for f in sample_dicom_set]
+        first = get_preferred_views([])
+        first.clear()
+
+        assert len(get_preferred_views([])) == 4
+        result = get_preferred_views(records)
+        assert len(result) == 4
+        assert sum(v is not None for v in result.values()) >= 1
+        assert all(v is None for v in get_preferred_views([]).values())
+
     def test_get_preferred_views_with_records(self, sample_dicom_set):
         """Test get_preferred_views with actual DICOM files."""
-        # Load all DICOM files from fixtures
-        records = [MammogramRecord.from_file(str(f)) for f in sample_dicom_set]
+        # Load all DICOM files from fixtures, passing the Path objects directly
+        records = MammogramRecord.from_paths(iter(sample_dicom_set))
         result = get_preferred_views(records)
 
         # Should return dict with 4 standard views
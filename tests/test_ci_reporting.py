@@ -291,6 +291,19 @@ def test_full_lane_builds_bindings_before_quality_without_rebuilding_for_tests()
     assert "run: make test-rust test-python" in workflow
 
 
+def test_python_tests_are_collected_before_they_run() -> None:
+    workflow = (REPOSITORY_ROOT / ".github" / "workflows" / "ci.yml").read_text(encoding="utf-8")
+
+    # Collection writes the assertion-rewritten bytecode before the test run
+    assert workflow.index("- name: Collect minimum-Python tests") < workflow.index(
+        "- name: Test minimum Python"
+    )
+    assert workflow.index("- name: Collect full-Python tests") < workflow.index(
+        "- name: Run full Rust and Python tests"
+    )
+    assert workflow.count("run: uv run pytest tests/ --collect-only -q") == 2
+
+
 def test_hosted_cargo_caches_only_store_download_archives() -> None:
     workflow_directory = REPOSITORY_ROOT / ".github" / "workflows"
 
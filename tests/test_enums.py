@@ -1,7 +1,10 @@
 """Tests for mammocat enum types."""
 
+import pytest
+
 from mammocat import (
     DbtObjectKind,
+    FilterConfig,
     ImageType,
     Laterality,
     MammogramType,
@@ -12,15 +15,59 @@ from mammocat import (
     ViewPosition,
 )
 
+# Extension enums are not iterable, so members are listed once here in
+# ascending sort order
+_MAMMOGRAM_TYPES = (
+    MammogramType.TOMO,
+    MammogramType.FFDM,
+    MammogramType.SYNTH,
+    MammogramType.SFM,
+    MammogramType.UNKNOWN,
+)
+
+_VIEW_POSITIONS = (
+    ViewPosition.UNKNOWN,
+    ViewPosition.XCCL,
+    ViewPosition.XCCM,
+    ViewPosition.CC,
+    ViewPosition.MLO,
+    ViewPosition.ML,
+    ViewPosition.LMO,
+    ViewPosition.LM,
+    ViewPosition.FB,
+    ViewPosition.SIO,
+    ViewPosition.ISO,
+    ViewPosition.SPECIMEN,
+)
+
+_EXPECTED_DBT_OBJECT_KIND_VALUES = {
+    DbtObjectKind.NONE: "none",
+    DbtObjectKind.VOLUME: "volume",
+    DbtObjectKind.SLICE: "slice",
+    DbtObjectKind.UNKNOWN: "unknown",
+}
+
+_EXPECTED_PREFERENCE_ORDER_VALUES = {
+    PreferenceOrder.DEFAULT: "default",
+    PreferenceOrder.TOMO_FIRST: "tomo-first",
+    PreferenceOrder.SYNTHETIC_2D_FIRST: "synthetic-2d-first",
+}
+
 
 class TestMammogramType:
-    def test_enum_values(self):
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            pytest.param(MammogramType.FFDM, "ffdm", id="FFDM"),
+            pytest.param(MammogramType.TOMO, "tomo", id="TOMO"),
+            pytest.param(MammogramType.SYNTH, "synth", id="SYNTH"),
+            pytest.param(MammogramType.SFM, "sfm", id="SFM"),
+            pytest.param(MammogramType.UNKNOWN, "unknown", id="UNKNOWN"),
+        ],
+    )
+    def test_enum_values(self, member, expected):
         """Test MammogramType enum values."""
-        assert MammogramType.FFDM.value == "ffdm"
-        assert MammogramType.TOMO.value == "tomo"
-        assert MammogramType.SYNTH.value == "synth"
-        assert MammogramType.SFM.value == "sfm"
-        assert MammogramType.UNKNOWN.value == "unknown"
+        assert member.value == expected
 
     def test_string_representation(self):
         """Test string representation."""
@@ -38,15 +85,16 @@ class TestMammogramType:
         assert MammogramType.FFDM != MammogramType.TOMO
 
     def test_hash(self):
-        """Test that enums are hashable."""
-        enum_set = {MammogramType.FFDM, MammogramType.TOMO, MammogramType.FFDM}
-        assert len(enum_set) == 2
+        """Test that equal enums hash equally and distinct members stay distinct keys."""
+        ffdm = FilterConfig(allowed_types=[MammogramType.FFDM]).allowed_types[0]
+        assert ffdm is not MammogramType.FFDM
+        assert hash(ffdm) == hash(MammogramType.FFDM)
+        assert {ffdm: "ffdm"}[MammogramType.FFDM] == "ffdm"
+        assert len(dict.fromkeys(_MAMMOGRAM_TYPES)) == len(_MAMMOGRAM_TYPES)
 
     def test_ordering(self):
         """Test ordering comparisons."""
-        assert MammogramType.TOMO < MammogramType.FFDM
-        assert MammogramType.FFDM < MammogramType.SYNTH
-        assert MammogramType.SYNTH < MammogramType.SFM
+        assert tuple(sorted(reversed(_MAMMOGRAM_TYPES))) == _MAMMOGRAM_TYPES
 
     def test_is_preferred_to(self):
         """Test preference comparison."""
@@ -58,17 +106,13 @@ class TestMammogramType:
 class TestDbtObjectKind:
     def test_enum_values(self):
         """Test DbtObjectKind enum values."""
-        assert DbtObjectKind.NONE.value == "none"
-        assert DbtObjectKind.VOLUME.value == "volume"
-        assert DbtObjectKind.SLICE.value == "slice"
-        assert DbtObjectKind.UNKNOWN.value == "unknown"
+        actual = {member: member.value for member in _EXPECTED_DBT_OBJECT_KIND_VALUES}
+        assert actual == _EXPECTED_DBT_OBJECT_KIND_VALUES
 
     def test_string_representation(self):
         """Test string representation."""
-        assert str(DbtObjectKind.NONE) == "none"
-        assert str(DbtObjectKind.VOLUME) == "volume"
-        assert str(DbtObjectKind.SLICE) == "slice"
-        assert str(DbtObjectKind.UNKNOWN) == "unknown"
+        actual = {member: str(member) for member in _EXPECTED_DBT_OBJECT_KIND_VALUES}
+        assert actual == _EXPECTED_DBT_OBJECT_KIND_VALUES
 
     def test_equality(self):
         """Test equality comparison."""
@@ -77,13 +121,19 @@ class TestDbtObjectKind:
 
 
 class TestLaterality:
-    def test_enum_values(self):
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            pytest.param(Laterality.LEFT, "left", id="LEFT"),
+            pytest.param(Laterality.RIGHT, "right", id="RIGHT"),
+            pytest.param(Laterality.BILATERAL, "bilateral", id="BILATERAL"),
+            pytest.param(Laterality.NONE, "none", id="NONE"),
+            pytest.param(Laterality.UNKNOWN, "unknown", id="UNKNOWN"),
+        ],
+    )
+    def test_enum_values(self, member, expected):
         """Test Laterality enum values."""
-        assert Laterality.LEFT.value == "left"
-        assert Laterality.RIGHT.value == "right"
-        assert Laterality.BILATERAL.value == "bilateral"
-        assert Laterality.NONE.value == "none"
-        assert Laterality.UNKNOWN.value == "unknown"
+        assert member.value == expected
 
     def test_string_representation(self):
         """Test string representation."""
@@ -109,24 +159,38 @@ class TestLaterality:
         assert Laterality.LEFT != Laterality.RIGHT
 
     def test_hash(self):
-        """Test that enums are hashable."""
-        lat_set = {Laterality.LEFT, Laterality.RIGHT, Laterality.LEFT}
-        assert len(lat_set) == 2
+        """Test that equal enums hash equally and distinct members stay distinct keys."""
+        left = MammogramView(Laterality.LEFT, ViewPosition.CC).laterality
+        right = Laterality.LEFT.opposite()
+        assert left is not Laterality.LEFT
+        assert hash(left) == hash(Laterality.LEFT)
+        assert hash(right) == hash(Laterality.RIGHT)
+        assert {left: "left", right: "right"}[Laterality.LEFT] == "left"
+        assert len({Laterality.LEFT: None, Laterality.RIGHT: None, left: None, right: None}) == 2
 
 
 class TestViewPosition:
-    def test_enum_values(self):
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            pytest.param(ViewPosition.CC, "cc", id="CC"),
+            pytest.param(ViewPosition.MLO, "mlo", id="MLO"),
+            pytest.param(ViewPosition.XCCL, "xccl", id="XCCL"),
+            pytest.param(ViewPosition.FB, "fb", id="FB"),
+            pytest.param(ViewPosition.SIO, "sio", id="SIO"),
+            pytest.param(ViewPosition.ISO, "iso", id="ISO"),
+            pytest.param(ViewPosition.SPECIMEN, "specimen", id="SPECIMEN"),
+            pytest.param(ViewPosition.UNKNOWN, "", id="UNKNOWN"),
+        ],
+    )
+    def test_enum_values(self, member, expected):
         """Test ViewPosition enum values."""
-        assert ViewPosition.CC.value == "cc"
-        assert ViewPosition.MLO.value == "mlo"
-        assert ViewPosition.XCCL.value == "xccl"
-        assert ViewPosition.FB.value == "fb"
-        assert ViewPosition.SIO.value == "sio"
-        assert ViewPosition.ISO.value == "iso"
-        assert ViewPosition.SPECIMEN.value == "specimen"
-        assert ViewPosition.UNKNOWN.value == ""
-        assert not hasattr(ViewPosition, "AT")
-        assert not hasattr(ViewPosition, "CV")
+        assert member.value == expected
+
+    @pytest.mark.parametrize("name", ["AT", "CV"])
+    def test_removed_members(self, name):
+        """Test view positions outside the supported set are not exposed."""
+        assert not hasattr(ViewPosition, name)
 
     def test_is_standard_view(self):
         """Test is_standard_view method."""
@@ -151,8 +215,7 @@ class TestViewPosition:
 
     def test_ordering(self):
         """Test ordering comparisons."""
-        assert ViewPosition.UNKNOWN < ViewPosition.XCCL
-        assert ViewPosition.CC < ViewPosition.MLO
+        assert tuple(sorted(reversed(_VIEW_POSITIONS))) == _VIEW_POSITIONS
 
 
 class TestMammographyViewModifier:
@@ -198,35 +261,40 @@ class TestMammographyViewModifier:
 class TestPreferenceOrder:
     def test_enum_values(self):
         """Test PreferenceOrder enum values."""
-        assert PreferenceOrder.DEFAULT.value == "default"
-        assert PreferenceOrder.TOMO_FIRST.value == "tomo-first"
-        assert PreferenceOrder.SYNTHETIC_2D_FIRST.value == "synthetic-2d-first"
+        actual = {member: member.value for member in _EXPECTED_PREFERENCE_ORDER_VALUES}
+        assert actual == _EXPECTED_PREFERENCE_ORDER_VALUES
 
     def test_string_representation(self):
         """Test string representation."""
-        assert str(PreferenceOrder.DEFAULT) == "default"
-        assert str(PreferenceOrder.TOMO_FIRST) == "tomo-first"
-        assert str(PreferenceOrder.SYNTHETIC_2D_FIRST) == "synthetic-2d-first"
+        actual = {member: str(member) for member in _EXPECTED_PREFERENCE_ORDER_VALUES}
+        assert actual == _EXPECTED_PREFERENCE_ORDER_VALUES
 
 
 class TestPhotometricInterpretation:
-    def test_enum_values(self):
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            pytest.param(PhotometricInterpretation.MONOCHROME1, "MONOCHROME1", id="MONOCHROME1"),
+            pytest.param(PhotometricInterpretation.MONOCHROME2, "MONOCHROME2", id="MONOCHROME2"),
+            pytest.param(PhotometricInterpretation.RGB, "RGB", id="RGB"),
+        ],
+    )
+    def test_enum_values(self, member, expected):
         """Test PhotometricInterpretation enum values."""
-        assert PhotometricInterpretation.MONOCHROME1 is not None
-        assert PhotometricInterpretation.MONOCHROME2 is not None
-        assert PhotometricInterpretation.RGB is not None
-
-    def test_is_monochrome(self):
-        """Test is_monochrome method."""
-        assert PhotometricInterpretation.MONOCHROME1.is_monochrome()
-        assert PhotometricInterpretation.MONOCHROME2.is_monochrome()
-        assert not PhotometricInterpretation.RGB.is_monochrome()
-
-    def test_num_channels(self):
-        """Test num_channels method."""
-        assert PhotometricInterpretation.MONOCHROME1.num_channels() == 1
-        assert PhotometricInterpretation.MONOCHROME2.num_channels() == 1
-        assert PhotometricInterpretation.RGB.num_channels() == 3
+        assert member.value == expected
+
+    @pytest.mark.parametrize(
+        ("member", "monochrome", "channels"),
+        [
+            pytest.param(PhotometricInterpretation.MONOCHROME1, True, 1, id="MONOCHROME1"),
+            pytest.param(PhotometricInterpretation.MONOCHROME2, True, 1, id="MONOCHROME2"),
+            pytest.param(PhotometricInterpretation.RGB, False, 3, id="RGB"),
+        ],
+    )
+    def test_is_monochrome_and_num_channels(self, member, monochrome, channels):
+        """Test is_monochrome and num_channels methods."""
+        assert member.is_monochrome() is monochrome
+        assert member.num_channels() == channels
 
 
 class TestImageType:
@@ -249,10 +317,10 @@ class TestImageType:
     def test_contains(self):
         """Test contains method."""
         img_type = ImageType("ORIGINAL", "PRIMARY", "POST_PROCESSED", ["SUBTRACTION"])
-        assert img_type.contains("ORIGINAL")
-        assert img_type.contains("PRIMARY")
-        assert img_type.contains("POST_PROCESSED")
-        assert img_type.contains("SUBTRACTION")
+        assert all(
+            img_type.contains(value)
+            for value in ("ORIGINAL", "PRIMARY", "POST_PROCESSED", "SUBTRACTION")
+        )
         assert not img_type.contains("DERIVED")
 
     def test_is_valid(self):
@@ -268,6 +336,31 @@ class TestImageType:
         assert "PRIMARY" in str(img_type)
 
 
+@pytest.fixture(scope="module")
+def view_left_cc():
+    return MammogramView(Laterality.LEFT, ViewPosition.CC)
+
+
+@pytest.fixture(scope="module")
+def view_left_mlo():
+    return MammogramView(Laterality.LEFT, ViewPosition.MLO)
+
+
+@pytest.fixture(scope="module")
+def view_left_ml():
+    return MammogramView(Laterality.LEFT, ViewPosition.ML)
+
+
+@pytest.fixture(scope="module")
+def view_right_cc():
+    return MammogramView(Laterality.RIGHT, ViewPosition.CC)
+
+
+@pytest.fixture(scope="module")
+def view_right_mlo():
+    return MammogramView(Laterality.RIGHT, ViewPosition.MLO)
+
+
 class TestMammogramView:
     def test_constructor(self):
         """Test MammogramView construction."""
@@ -275,44 +368,34 @@ class TestMammogramView:
         assert view.laterality == Laterality.LEFT
         assert view.view == ViewPosition.CC
 
-    def test_is_standard_mammo_view(self):
+    def test_is_standard_mammo_view(self, view_left_cc, view_right_mlo, view_left_ml):
         """Test is_standard_mammo_view method."""
-        view_cc = MammogramView(Laterality.LEFT, ViewPosition.CC)
-        view_mlo = MammogramView(Laterality.RIGHT, ViewPosition.MLO)
-        view_ml = MammogramView(Laterality.LEFT, ViewPosition.ML)
-
-        assert view_cc.is_standard_mammo_view()
-        assert view_mlo.is_standard_mammo_view()
-        assert not view_ml.is_standard_mammo_view()
+        assert view_left_cc.is_standard_mammo_view()
+        assert view_right_mlo.is_standard_mammo_view()
+        assert not view_left_ml.is_standard_mammo_view()
 
-    def test_is_mlo_like(self):
+    def test_is_mlo_like(self, view_left_mlo, view_left_cc):
         """Test is_mlo_like method."""
-        view_mlo = MammogramView(Laterality.LEFT, ViewPosition.MLO)
-        view_cc = MammogramView(Laterality.LEFT, ViewPosition.CC)
-
-        assert view_mlo.is_mlo_like()
-        assert not view_cc.is_mlo_like()
+        assert view_left_mlo.is_mlo_like()
+        assert not view_left_cc.is_mlo_like()
 
-    def test_is_cc_like(self):
+    def test_is_cc_like(self, view_left_cc, view_left_mlo):
         """Test is_cc_like method."""
-        view_cc = MammogramView(Laterality.LEFT, ViewPosition.CC)
-        view_mlo = MammogramView(Laterality.LEFT, ViewPosition.MLO)
-
-        assert view_cc.is_cc_like()
-        assert not view_mlo.is_cc_like()
+        assert view_left_cc.is_cc_like()
+        assert not view_left_mlo.is_cc_like()
 
-    def test_equality(self):
+    def test_equality(self, view_left_cc, view_right_cc):
         """Test equality comparison."""
-        view1 = MammogramView(Laterality.LEFT, ViewPosition.CC)
-        view2 = MammogramView(Laterality.LEFT, ViewPosition.CC)
-        view3 = MammogramView(Laterality.RIGHT, ViewPosition.CC)
-
-        assert view1 == view2
-        assert view1 != view3
-
-    def test_hash(self):
-        """Test that views are hashable."""
-        view1 = MammogramView(Laterality.LEFT, ViewPosition.CC)
-        view2 = MammogramView(Laterality.LEFT, ViewPosition.CC)
-        view_set = {view1, view2}
+        assert view_left_cc == MammogramView(Laterality.LEFT, ViewPosition.CC)
+        assert view_left_cc != view_right_cc
+
+    def test_hash(self, view_left_cc, view_right_cc):
+        """Test that equal views hash equally."""
+        assert hash(view_left_cc) == hash(MammogramView(Laterality.LEFT, ViewPosition.CC))
+        assert hash(view_right_cc) == hash(MammogramView(Laterality.RIGHT, ViewPosition.CC))
+        assert view_left_cc != view_right_cc
+
+    def test_set_membership(self, view_left_cc):
+        """Test that equal views collapse to one set member."""
+        view_set = {view_left_cc, MammogramView(Laterality.LEFT, ViewPosition.CC)}
         assert len(view_set) == 1